@@ -1,11 +1,18 @@
 """Default Load Balancer Algorithm."""
 
+from collections import defaultdict, deque
+from functools import partial
 from statistics import median
 from time import time
 
 from ..meters.meter import Phase  # noqa: TID252
 from .balancer import Balancer
 
+# Upper bound on buffered samples per phase. Keeps memory flat when the
+# hysteresis period is long, while still covering the default 5 minute
+# period at a 1 second cadence.
+MAX_BUFFERED_SAMPLES: int = 512
+
 
 class DefaultLoadBalancer(Balancer):
     """
@@ -18,10 +25,14 @@ class DefaultLoadBalancer(Balancer):
     def __init__(self, hysteresis_period: int = 5 * 60) -> None:
         """Init."""
         self.hysteresis_period = hysteresis_period  # seconds
-        self._buffers: dict[Phase, list[int]] = {phase: [] for phase in Phase}
+        self._buffers: dict[Phase, deque[int]] = {
+            phase: deque(maxlen=MAX_BUFFERED_SAMPLES) for phase in Phase
+        }
         self._last_update: dict[Phase, float] = dict.fromkeys(Phase, 0.0)
-        self._hysteresis_start = dict.fromkeys(Phase)
-        self._hysteresis_buffer = dict.fromkeys(Phase)
+        self._hysteresis_start: dict[Phase, int] = {}
+        self._hysteresis_buffer: defaultdict[Phase, deque[int]] = defaultdict(
+            partial(deque, maxlen=MAX_BUFFERED_SAMPLES)
+        )
 
     def compute_availability(
         self,
@@ -32,8 +43,7 @@ class DefaultLoadBalancer(Balancer):
     ) -> dict[Phase, int]:
         """Compute current limits limits."""
         new_limits = current_limits.copy()
-        for phase in Phase:
-            avail = available_currents[phase]
+        for phase, avail in available_currents.items():
             current = current_limits[phase]
             max_limit = max_limits[phase]
             # Immediate reduction if consumption is over the limit:
@@ -62,23 +72,20 @@ class DefaultLoadBalancer(Balancer):
     ) -> int | None:
         """Apply hysteresis to the current limit for a given phase."""
         now = int(time())
-        if self._hysteresis_start[phase] is None:
-            self._hysteresis_start[phase] = now
-            self._hysteresis_buffer[phase] = []
-
+        # A missing start marks a fresh window; the buffer is created on demand
+        start_time = self._hysteresis_start.setdefault(phase, now)
         buffer = self._hysteresis_buffer[phase]
-        start_time = self._hysteresis_start[phase]
 
         buffer.append(available_current)
         elapsed_min = (now - start_time) / 60
 
         if elapsed_min >= self.hysteresis_period:
-            smoothened_current = int(median(self._hysteresis_buffer[phase]))
+            smoothened_current = int(median(buffer))
             self._reset_hysteresis(phase)
             return smoothened_current
 
         return None
 
     def _reset_hysteresis(self, phase: Phase) -> None:
-        self._hysteresis_start[phase] = None
-        self._hysteresis_buffer[phase] = []
+        self._hysteresis_start.pop(phase, None)
+        self._hysteresis_buffer.pop(phase, None)
@@ -44,12 +44,11 @@ class OptimisedLoadBalancer(Balancer):
         now: float = time(),
     ) -> dict[Phase, int]:
         """Compute available currents."""
-        available = {}
-        for phase, current in available_currents.items():
-            available[phase] = self._phase_monitors[phase].update(
-                avail=current, now=now
-            )
-        return available
+        phase_monitors = self._phase_monitors
+        return {
+            phase: phase_monitors[phase].update(avail=current, now=now)
+            for phase, current in available_currents.items()
+        }
 
 
 class PhaseMonitor:
@@ -12,6 +12,7 @@ from ..const import (  # noqa: TID252
     HA_INTEGRATION_DOMAIN_MQTT,
     Z2M_DEVICE_IDENTIFIER_DOMAIN,
     Phase,
+    all_phases,
 )
 from .charger import Charger, PhaseMode
 from .util.zigbee2mqtt import (
@@ -59,6 +60,13 @@ class AminaStatusMap(StrEnum):
 AMINA_HW_MAX_CURRENT = 32
 AMINA_HW_MIN_CURRENT = 6
 
+_CAN_CHARGE_STATUSES = frozenset(
+    {
+        AminaStatusMap.Charging,
+        AminaStatusMap.ReadyToCharge,
+    }
+)
+
 
 class AminaCharger(Zigbee2Mqtt, Charger):
     """Representation of an Amina S Charger using MQTT."""
@@ -103,13 +111,13 @@ class AminaCharger(Zigbee2Mqtt, Charger):
         if mode == PhaseMode.SINGLE:
             single_phase = "enable"
 
-        await self._async_mqtt_publish(
+        await self._publish(
             topic=self._topic_set, payload={AminaPropertyMap.SinglePhase: single_phase}
         )
 
     async def set_current_limit(self, limit: dict[Phase, int]) -> None:
         """Set the charger limit."""
-        requested_current = max(limit.values()) if limit.values() else 0
+        requested_current = max(limit.values(), default=0)
         
         # Determine the state (ON/OFF) and current value to send
         if requested_current < AMINA_HW_MIN_CURRENT:
@@ -122,12 +130,12 @@ class AminaCharger(Zigbee2Mqtt, Charger):
             state_value = "ON"
             
         # Publish the charge limit
-        await self._async_mqtt_publish(
+        await self._publish(
             topic=self._topic_set, payload={AminaPropertyMap.ChargeLimit: current_value}
         )
         
         # Publish the state (ON/OFF)
-        await self._async_mqtt_publish(
+        await self._publish(
             topic=self._topic_set, payload={AminaPropertyMap.State: state_value}
         )
 
@@ -143,11 +151,11 @@ class AminaCharger(Zigbee2Mqtt, Charger):
 
         if is_single_phase_val:
             return {Phase.L1: current_limit_int, Phase.L2: 0, Phase.L3: 0}
-        return dict.fromkeys(Phase, current_limit_int)
+        return all_phases(current_limit_int)
 
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Get the hardware maximum current limit of the charger."""
-        return dict.fromkeys(Phase, AMINA_HW_MAX_CURRENT)
+        return all_phases(AMINA_HW_MAX_CURRENT)
 
     def car_connected(self) -> bool:
         """Return whether the car is connected."""
@@ -167,10 +175,7 @@ class AminaCharger(Zigbee2Mqtt, Charger):
         if current_limit is not None and int(current_limit) == 0:
             return True
 
-        return ev_status in (
-            AminaStatusMap.Charging,
-            AminaStatusMap.ReadyToCharge,
-        )
+        return ev_status in _CAN_CHARGE_STATUSES
 
     def has_synced_phase_limits(self) -> bool:
         """Return whether the charger has synced phase limits."""
@@ -74,6 +74,15 @@ class Charger(ABC):
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Get the configured maximum current limit of the charger in amps."""
 
+    def get_tracking_entities(self) -> list[str]:
+        """
+        Return a list of entity IDs that should be tracked for the charger.
+
+        Chargers that don't expose their state through entities keep the
+        default and are picked up by the coordinator's fallback cycle.
+        """
+        return []
+
     @abstractmethod
     def car_connected(self) -> bool:
         """
@@ -6,8 +6,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from ..const import CHARGER_DOMAIN_EASEE, Phase  # noqa: TID252
+from ..const import CHARGER_DOMAIN_EASEE, Phase, all_phases  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
+from ..utils import parse_int_state  # noqa: TID252
 from .charger import Charger, PhaseMode
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,6 +46,23 @@ class EaseeStatusMap:
     DeAuthorization = "de_authorizing"
 
 
+_CONNECTED_STATUSES = frozenset(
+    {
+        EaseeStatusMap.AwaitingStart,
+        EaseeStatusMap.Charging,
+        EaseeStatusMap.Completed,
+        EaseeStatusMap.ReadyToCharge,
+    }
+)
+_CAN_CHARGE_STATUSES = frozenset(
+    {
+        EaseeStatusMap.AwaitingStart,
+        EaseeStatusMap.Charging,
+        EaseeStatusMap.ReadyToCharge,
+    }
+)
+
+
 class EaseeCharger(HaDevice, Charger):
     """Implementation of the Charger class for Easee chargers."""
 
@@ -60,7 +78,7 @@ class EaseeCharger(HaDevice, Charger):
     def is_charger_device(device: DeviceEntry) -> bool:
         """Check if the given device is an Easee charger."""
         return any(
-            id_domain == CHARGER_DOMAIN_EASEE for id_domain, _ in device.identifiers
+            identifier[0] == CHARGER_DOMAIN_EASEE for identifier in device.identifiers
         )
 
     async def async_setup(self) -> None:
@@ -108,7 +126,10 @@ class EaseeCharger(HaDevice, Charger):
             )
             return None
 
-        return dict.fromkeys(Phase, int(state))
+        current_limit = parse_int_state(state)
+        if current_limit is None:
+            return None
+        return all_phases(current_limit)
 
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Return maximum configured current for the charger."""
@@ -124,7 +145,11 @@ class EaseeCharger(HaDevice, Charger):
                 )
             )
             return None
-        return dict.fromkeys(Phase, int(state))
+
+        max_limit = parse_int_state(state)
+        if max_limit is None:
+            return None
+        return all_phases(max_limit)
 
     def has_synced_phase_limits(self) -> bool:
         """
@@ -135,6 +160,15 @@ class EaseeCharger(HaDevice, Charger):
         """
         return True
 
+    def get_tracking_entities(self) -> list[str]:
+        """Return the status entity, so (dis)connecting a car triggers a cycle."""
+        try:
+            return [self._get_entity_id_by_translation_key(EaseeEntityMap.Status)]
+        except ValueError as ex:
+            # A removed or renamed status entity shouldn't fail the setup
+            _LOGGER.warning("Not tracking the charger status: %s", ex)
+            return []
+
     def _get_status(self) -> str | None:
         return self._get_entity_state_by_translation_key(
             EaseeEntityMap.Status,
@@ -143,21 +177,12 @@ class EaseeCharger(HaDevice, Charger):
     def car_connected(self) -> bool:
         """See abstract Charger class for correct implementation of this method."""
         status = self._get_status()
-        return status in [
-            EaseeStatusMap.AwaitingStart,
-            EaseeStatusMap.Charging,
-            EaseeStatusMap.Completed,
-            EaseeStatusMap.ReadyToCharge,
-        ]
+        return status in _CONNECTED_STATUSES
 
     def can_charge(self) -> bool:
         """See abstract Charger class for correct implementation of this method."""
         status = self._get_status()
-        return status in [
-            EaseeStatusMap.AwaitingStart,
-            EaseeStatusMap.Charging,
-            EaseeStatusMap.ReadyToCharge,
-        ]
+        return status in _CAN_CHARGE_STATUSES
 
     async def async_unload(self) -> None:
         """Unload the Easee charger."""
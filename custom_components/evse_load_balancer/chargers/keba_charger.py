@@ -6,8 +6,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from ..const import CHARGER_DOMAIN_KEBA, Phase  # noqa: TID252
+from ..const import CHARGER_DOMAIN_KEBA, Phase, all_phases  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
+from ..utils import parse_int_state  # noqa: TID252
 from .charger import Charger, PhaseMode
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,6 +40,21 @@ class KebaChargingStateMap:
     Interrupted = "5"
 
 
+_CONNECTED_STATUSES = frozenset(
+    {
+        KebaChargingStateMap.ReadyToCharge,
+        KebaChargingStateMap.Charging,
+        KebaChargingStateMap.Interrupted,
+    }
+)
+_CAN_CHARGE_STATUSES = frozenset(
+    {
+        KebaChargingStateMap.ReadyToCharge,
+        KebaChargingStateMap.Charging,
+    }
+)
+
+
 class KebaCharger(HaDevice, Charger):
     """Implementation of the Charger class for Keba chargers."""
 
@@ -50,11 +66,15 @@ class KebaCharger(HaDevice, Charger):
         Charger.__init__(self, hass, config_entry, device_entry)
         self.refresh_entities()
 
+        self._uid_prefix = self.device_entry.id + "_"
+        self._uid_charging_state = self._compose_unique_id(KebaEntityMap.ChargingState)
+        self._uid_max_current = self._compose_unique_id(KebaEntityMap.MaxCurrent)
+
     @staticmethod
     def is_charger_device(device: DeviceEntry) -> bool:
         """Check if the given device is a Keba charger."""
         return any(
-            id_domain == CHARGER_DOMAIN_KEBA for id_domain, _ in device.identifiers
+            identifier[0] == CHARGER_DOMAIN_KEBA for identifier in device.identifiers
         )
 
     async def async_setup(self) -> None:
@@ -88,9 +108,7 @@ class KebaCharger(HaDevice, Charger):
 
     def get_current_limit(self) -> dict[Phase, int] | None:
         """See base class for correct implementation of this method."""
-        state = self._get_entity_state_by_unique_id(
-            self._compose_unique_id(KebaEntityMap.MaxCurrent)
-        )
+        state = self._get_entity_state_by_unique_id(self._uid_max_current)
         if state is None:
             _LOGGER.warning(
                 "Max Charger limit not available. Make sure the required entity "
@@ -99,7 +117,10 @@ class KebaCharger(HaDevice, Charger):
             )
             return None
 
-        return dict.fromkeys(Phase, int(state))
+        current_limit = parse_int_state(state)
+        if current_limit is None:
+            return None
+        return all_phases(current_limit)
 
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """
@@ -109,7 +130,7 @@ class KebaCharger(HaDevice, Charger):
         the maximum current limit, so we return a default value representing
         the charger's maximum current limit.
         """
-        return dict.fromkeys(Phase, 32)
+        return all_phases(32)
 
     def has_synced_phase_limits(self) -> bool:
         """
@@ -120,31 +141,31 @@ class KebaCharger(HaDevice, Charger):
         """
         return True
 
+    def get_tracking_entities(self) -> list[str]:
+        """Return the status entity, so (dis)connecting a car triggers a cycle."""
+        try:
+            return [self._get_entity_id_by_unique_id(self._uid_charging_state)]
+        except ValueError as ex:
+            # A removed or renamed status entity shouldn't fail the setup
+            _LOGGER.warning("Not tracking the charger status: %s", ex)
+            return []
+
     def _get_status(self) -> str | None:
-        return self._get_entity_state_by_unique_id(
-            self._compose_unique_id(KebaEntityMap.ChargingState)
-        )
+        return self._get_entity_state_by_unique_id(self._uid_charging_state)
 
     def car_connected(self) -> bool:
         """See abstract Charger class for correct implementation of this method."""
         status = self._get_status()
-        return status in [
-            KebaChargingStateMap.ReadyToCharge,
-            KebaChargingStateMap.Charging,
-            KebaChargingStateMap.Interrupted,
-        ]
+        return status in _CONNECTED_STATUSES
 
     def can_charge(self) -> bool:
         """See abstract Charger class for correct implementation of this method."""
         status = self._get_status()
-        return status in [
-            KebaChargingStateMap.ReadyToCharge,
-            KebaChargingStateMap.Charging,
-        ]
+        return status in _CAN_CHARGE_STATUSES
 
     async def async_unload(self) -> None:
         """Unload the charger."""
 
     def _compose_unique_id(self, entity_key: str) -> str:
         """Compose a unique ID for the Keba charger entity."""
-        return f"{self.device_entry.id}_{entity_key}"
+        return self._uid_prefix + entity_key
@@ -6,8 +6,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from ..const import CHARGER_DOMAIN_LEKTRICO, Phase  # noqa: TID252
+from ..const import (  # noqa: TID252
+    CHARGER_DOMAIN_LEKTRICO,
+    Phase,
+    all_phases,
+)
 from ..ha_device import HaDevice  # noqa: TID252
+from ..utils import parse_int_state  # noqa: TID252
 from .charger import Charger, PhaseMode
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,6 +51,22 @@ class LektricoStatusMap:
     Updating = "updating_firmware"
 
 
+_CONNECTED_STATUSES = frozenset(
+    {
+        LektricoStatusMap.Connected,
+        LektricoStatusMap.Charging,
+        LektricoStatusMap.Paused,
+        LektricoStatusMap.PausedByScheduler,
+    }
+)
+_CAN_CHARGE_STATUSES = frozenset(
+    {
+        LektricoStatusMap.Connected,
+        LektricoStatusMap.Charging,
+    }
+)
+
+
 # Hardware limits for Lektri.co
 LEKTRICO_HW_MAX_CURRENT = 32
 LEKTRICO_HW_MIN_CURRENT = 0  # 0 == pause
@@ -66,7 +87,8 @@ class LektricoCharger(HaDevice, Charger):
     def is_charger_device(device: DeviceEntry) -> bool:
         """Check if the given device is an Lektri.co charger."""
         return any(
-            id_domain == CHARGER_DOMAIN_LEKTRICO for id_domain, _ in device.identifiers
+            identifier[0] == CHARGER_DOMAIN_LEKTRICO
+            for identifier in device.identifiers
         )
 
     async def async_setup(self) -> None:
@@ -128,17 +150,32 @@ class LektricoCharger(HaDevice, Charger):
     def get_current_limit(self) -> dict[Phase, int] | None:
         """See base class for correct implementation of this method."""
         state = self._get_entity_state_by_key(LektricoEntityMap.DynamicChargerLimit)
-        return dict.fromkeys(Phase, int(state))
+        current_limit = parse_int_state(state)
+        if current_limit is None:
+            return None
+        return all_phases(current_limit)
 
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Return maximum configured current for the charger."""
         state = self._get_entity_state_by_key(LektricoEntityMap.MaxChargerLimit)
-        return dict.fromkeys(Phase, int(state))
+        max_limit = parse_int_state(state)
+        if max_limit is None:
+            return None
+        return all_phases(max_limit)
 
     def has_synced_phase_limits(self) -> bool:
         """Return whether the charger has synced phase limits."""
         return True
 
+    def get_tracking_entities(self) -> list[str]:
+        """Return the status entity, so (dis)connecting a car triggers a cycle."""
+        try:
+            return [self._get_entity_id_by_key(LektricoEntityMap.Status)]
+        except ValueError as ex:
+            # A removed or renamed status entity shouldn't fail the setup
+            _LOGGER.warning("Not tracking the charger status: %s", ex)
+            return []
+
     def _get_status(self) -> str | None:
         return self._get_entity_state_by_key(
             LektricoEntityMap.Status,
@@ -147,20 +184,12 @@ class LektricoCharger(HaDevice, Charger):
     def car_connected(self) -> bool:
         """See abstract Charger class for correct implementation of this method."""
         status = self._get_status()
-        return status in [
-            LektricoStatusMap.Connected,
-            LektricoStatusMap.Charging,
-            LektricoStatusMap.Paused,
-            LektricoStatusMap.PausedByScheduler,
-        ]
+        return status in _CONNECTED_STATUSES
 
     def can_charge(self) -> bool:
         """See abstract Charger class for correct implementation of this method."""
         status = self._get_status()
-        return status in [
-            LektricoStatusMap.Connected,
-            LektricoStatusMap.Charging,
-        ]
+        return status in _CAN_CHARGE_STATUSES
 
     async def async_unload(self) -> None:
         """Unload the Lektri.co charger."""
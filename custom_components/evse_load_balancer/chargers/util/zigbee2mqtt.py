@@ -3,13 +3,16 @@
 import asyncio
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import PublishPayloadType, ReceiveMessage
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.core import callback as ha_core_callback
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 _LOGGER = logging.getLogger(__name__)
 
 # Base MQTT topics for Zigbee2MQTT
@@ -50,7 +53,12 @@ class Zigbee2Mqtt:
         self._topic_get_base: str = f"{self._topic_state}/get"
 
         self._mqtt_listener: CALLBACK_TYPE | None = None
-        self._pending_requests: dict[str, asyncio.Future[Any]] = {}
+        # Publisher used by callers. Bound to the guarded publisher until the
+        # subscription is in place, after which it is swapped for the direct one.
+        self._publish: Callable[..., Awaitable[None]] = self._async_mqtt_publish
+        # Waiters per property. Concurrent requests for the same property
+        # all resolve on the next state message carrying that property.
+        self._pending_requests: dict[str, list[asyncio.Future[Any]]] = {}
 
         """
         Property containing state cache.
@@ -78,6 +86,7 @@ class Zigbee2Mqtt:
             self.hass, self._topic_state, self.message_received, qos=0, encoding="utf-8"
         )
         self._mqtt_listener = mqtt_listener
+        self._publish = self._async_mqtt_publish_unsafe
         _LOGGER.debug("Successfully subscribed to MQTT topic '%s'.", self._topic_state)
 
     @ha_core_callback
@@ -104,9 +113,9 @@ class Zigbee2Mqtt:
 
             # Resolve pending_requests futures (async_get_property calls)
             for property_name in updated_properties:
-                prop_future = self._pending_requests.get(property_name, None)
-                if prop_future and not prop_future.done():
-                    prop_future.set_result(self._state_cache[property_name])
+                for prop_future in self._pending_requests.pop(property_name, ()):
+                    if not prop_future.done():
+                        prop_future.set_result(self._state_cache[property_name])
 
         except json.JSONDecodeError:
             _LOGGER.exception(
@@ -123,10 +132,10 @@ class Zigbee2Mqtt:
     async def async_get_property(self, property_name: str, timeout: float = 7.0) -> Any:  # noqa: ASYNC109
         """Get a property value with proper request-response correlation."""
         response_future = self.hass.loop.create_future()
-        self._pending_requests[property_name] = response_future
+        self._pending_requests.setdefault(property_name, []).append(response_future)
 
         try:
-            await self._async_mqtt_publish(
+            await self._publish(
                 topic=self._topic_get_base, payload={property_name: ""}, qos=1
             )
             return await asyncio.wait_for(response_future, timeout)
@@ -134,7 +143,11 @@ class Zigbee2Mqtt:
             _LOGGER.warning("Timeout waiting for response to '%s'", property_name)
             return None
         finally:
-            self._pending_requests.pop(property_name, None)
+            waiters = self._pending_requests.get(property_name)
+            if waiters is not None and response_future in waiters:
+                waiters.remove(response_future)
+                if not waiters:
+                    del self._pending_requests[property_name]
 
     async def initialize_state_cache(self) -> None:
         """Initialize the state cache by requesting initial values via MQTT."""
@@ -172,6 +185,15 @@ class Zigbee2Mqtt:
             _LOGGER.error("MQTT not set up, cannot publish to topic '%s'.", topic)
             return
 
+        await self._async_mqtt_publish_unsafe(topic=topic, payload=payload, qos=qos)
+
+    async def _async_mqtt_publish_unsafe(
+        self,
+        topic: str | dict,
+        payload: dict | PublishPayloadType,
+        qos: int = 0,
+    ) -> None:
+        """Publish without checking the subscription; only bound once set up."""
         if isinstance(payload, dict):
             payload = json.dumps(payload)
 
@@ -205,8 +227,10 @@ class Zigbee2Mqtt:
 
         self._mqtt_listener()
         self._mqtt_listener = None
+        self._publish = self._async_mqtt_publish
 
-        for future in self._pending_requests.values():
-            if not future.done():
-                future.cancel("MQTT connection unloaded before response received")
+        for waiters in self._pending_requests.values():
+            for future in waiters:
+                if not future.done():
+                    future.cancel("MQTT connection unloaded before response received")
         self._pending_requests.clear()
@@ -1,12 +1,13 @@
 """Zaptec Charger implementation."""
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from ..const import CHARGER_DOMAIN_ZAPTEC  # noqa: TID252
+from ..const import CHARGER_DOMAIN_ZAPTEC, all_phases  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
 from ..meters.meter import Phase  # Use the correct import path  # noqa: TID252
 from .charger import Charger, PhaseMode
@@ -38,6 +39,15 @@ class ZaptecStatusMap:
     ConnectedFinished = "connected_finished"
 
 
+# Status -> (car connected, can charge); unlisted statuses are neither
+_STATUS_CAPABILITIES: dict[str, tuple[bool, bool]] = {
+    ZaptecStatusMap.ConnectedRequesting: (True, False),
+    ZaptecStatusMap.ConnectedCharging: (True, True),
+    ZaptecStatusMap.ConnectedFinished: (True, False),
+}
+_NO_CAPABILITIES = (False, False)
+
+
 class ZaptecCharger(HaDevice, Charger):
     """Implementation of the Charger class for Zaptec chargers."""
 
@@ -47,13 +57,21 @@ class ZaptecCharger(HaDevice, Charger):
         """Initialize the Zaptec charger."""
         HaDevice.__init__(self, hass, device_entry)
         Charger.__init__(self, hass, config_entry, device_entry)
+        # Serializes limit writes so overlapping updates don't stack up
+        self._set_limit_lock = asyncio.Lock()
+        # Raw MaxChargingCurrent state and the limits parsed from it
+        self._current_limit_state: str | None = None
+        self._current_limit: dict[Phase, int] | None = None
+        # Raw AvailableCurrent state and the limits parsed from it
+        self._max_limit_state: str | None = None
+        self._max_limit: dict[Phase, int] | None = None
         self.refresh_entities()
 
     @staticmethod
     def is_charger_device(device: DeviceEntry) -> bool:
         """Check if the given device is a Zaptec charger."""
         return any(
-            id_domain == CHARGER_DOMAIN_ZAPTEC for id_domain, _ in device.identifiers
+            identifier[0] == CHARGER_DOMAIN_ZAPTEC for identifier in device.identifiers
         )
 
     async def async_setup(self) -> None:
@@ -77,16 +95,25 @@ class ZaptecCharger(HaDevice, Charger):
 
         value = min(limit.values())
 
-        # Call the Home Assistant number.set_value service
-        await self.hass.services.async_call(
-            domain="number",
-            service="set_value",
-            service_data={
-                "entity_id": charger_max_current_entity_id,
-                "value": value,
-            },
-            blocking=True,
-        )
+        async with self._set_limit_lock:
+            # Skip the service round-trip when the charger already reports the value
+            current_limit = self.get_current_limit()
+            if current_limit is not None and current_limit[Phase.L1] == value:
+                _LOGGER.debug(
+                    "Zaptec current limit already at %sA, skipping update", value
+                )
+                return
+
+            # Call the Home Assistant number.set_value service
+            await self.hass.services.async_call(
+                domain="number",
+                service="set_value",
+                service_data={
+                    "entity_id": charger_max_current_entity_id,
+                    "value": value,
+                },
+                blocking=True,
+            )
 
     def get_current_limit(self) -> dict[Phase, int] | None:
         """Get the current limit set on the charger."""
@@ -94,15 +121,21 @@ class ZaptecCharger(HaDevice, Charger):
             ZaptecEntityMap.MaxChargingCurrent
         )
 
+        if entity_state is not None and entity_state == self._current_limit_state:
+            return self._current_limit
+
         try:
             current_value = int(float(entity_state))
-            return dict.fromkeys(Phase, current_value)
         except (ValueError, TypeError):
             _LOGGER.exception(
                 "Could not convert current limit '%s' to number", entity_state
             )
             return None
 
+        self._current_limit_state = entity_state
+        self._current_limit = all_phases(current_value)
+        return self._current_limit
+
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Return maximum configured current for the charger."""
         state = self._get_entity_state_by_translation_key(
@@ -118,6 +151,9 @@ class ZaptecCharger(HaDevice, Charger):
             )
             return None
 
+        if state == self._max_limit_state:
+            return self._max_limit
+
         try:
             # Zaptec returns the same max value for all phases
             max_value = int(float(state))
@@ -125,16 +161,23 @@ class ZaptecCharger(HaDevice, Charger):
             _LOGGER.exception("Could not convert max current '%s' to number", state)
             return None
 
-        return {
-            Phase.L1: max_value,
-            Phase.L2: max_value,
-            Phase.L3: max_value,
-        }
+        self._max_limit_state = state
+        self._max_limit = all_phases(max_value)
+        return self._max_limit
 
     def has_synced_phase_limits(self) -> bool:
         """Return whether the charger has synced phase limits."""
         return True
 
+    def get_tracking_entities(self) -> list[str]:
+        """Return the status entity, so (dis)connecting a car triggers a cycle."""
+        try:
+            return [self._get_entity_id_by_translation_key(ZaptecEntityMap.Status)]
+        except ValueError as ex:
+            # A removed or renamed status entity shouldn't fail the setup
+            _LOGGER.warning("Not tracking the charger status: %s", ex)
+            return []
+
     def _get_status(self) -> str | None:
         """Get the current status of the charger."""
         return self._get_entity_state_by_translation_key(ZaptecEntityMap.Status)
@@ -142,22 +185,11 @@ class ZaptecCharger(HaDevice, Charger):
     def car_connected(self) -> bool:
         """Check if a car is connected to the charger."""
         # Fall back to status-based detection
-        status = self._get_status()
-        return status in (
-            ZaptecStatusMap.ConnectedRequesting,
-            ZaptecStatusMap.ConnectedCharging,
-            ZaptecStatusMap.ConnectedFinished,
-        )
+        return _STATUS_CAPABILITIES.get(self._get_status(), _NO_CAPABILITIES)[0]
 
     def can_charge(self) -> bool:
         """Check if the charger is in a state where it can charge."""
-        # First check if car is connected
-        if not self.car_connected():
-            return False
-
-        # Then check status to see if it's in a state where charging is possible
-        status = self._get_status()
-        return status in (ZaptecStatusMap.ConnectedCharging,)
+        return _STATUS_CAPABILITIES.get(self._get_status(), _NO_CAPABILITIES)[1]
 
     async def async_unload(self) -> None:
         """Unload the charger."""
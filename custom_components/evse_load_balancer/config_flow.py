@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -43,6 +44,7 @@ CONF_PHASE_COUNT = "phase_count"
 CONF_PHASE_KEY_ONE = "l1"
 CONF_PHASE_KEY_TWO = "l2"
 CONF_PHASE_KEY_THREE = "l3"
+_PHASE_KEYS = (CONF_PHASE_KEY_ONE, CONF_PHASE_KEY_TWO, CONF_PHASE_KEY_THREE)
 CONF_PHASE_SENSOR = "power"
 CONF_PHASE_SENSOR_CONSUMPTION = "power_consumption"
 CONF_PHASE_SENSOR_PRODUCTION = "power_production"
@@ -51,6 +53,9 @@ CONF_CUSTOM_PHASE_CONFIG = "custom_phase_config"
 CONF_METER_DEVICE = "meter_device"
 CONF_CHARGER_DEVICE = "charger_device"
 
+# see https://developers.home-assistant.io/blog/2024/11/12/options-flow/
+_HA_HAS_MODERN_OPTIONS_FLOW = parse_version(ha_version) >= parse_version("2024.11.0")
+
 _charger_device_filter_list: list[dict[str, str]] = [
     {"integration": CHARGER_DOMAIN_EASEE},
     {"integration": CHARGER_DOMAIN_ZAPTEC},
@@ -62,6 +67,10 @@ _charger_device_filter_list: list[dict[str, str]] = [
     },
 ]
 
+_meter_device_filter_list: list[dict[str, str]] = [
+    {"integration": domain} for domain in SUPPORTED_METER_DEVICE_DOMAINS
+]
+
 STEP_INIT_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_CHARGER_DEVICE): DeviceSelector(
@@ -79,9 +88,7 @@ STEP_INIT_SCHEMA = vol.Schema(
         vol.Optional(CONF_METER_DEVICE): DeviceSelector(
             DeviceSelectorConfig(
                 multiple=False,
-                filter=[
-                    {"integration": domain} for domain in SUPPORTED_METER_DEVICE_DOMAINS
-                ],
+                filter=_meter_device_filter_list,
             )
         ),
         vol.Optional(CONF_CUSTOM_PHASE_CONFIG): cv.boolean,
@@ -90,6 +97,37 @@ STEP_INIT_SCHEMA = vol.Schema(
 
 STEP_POWER_DATA_SCHEMA = {}
 
+# Sensor section shown for every phase in the power step
+_PHASE_SECTION_SCHEMA = section(
+    vol.Schema(
+        {
+            vol.Required(CONF_PHASE_SENSOR_CONSUMPTION): EntitySelector(
+                EntitySelectorConfig(
+                    multiple=False,
+                    domain="sensor",
+                    device_class=[SensorDeviceClass.POWER],
+                )
+            ),
+            vol.Required(CONF_PHASE_SENSOR_PRODUCTION): EntitySelector(
+                EntitySelectorConfig(
+                    multiple=False,
+                    domain="sensor",
+                    device_class=[SensorDeviceClass.POWER],
+                )
+            ),
+            vol.Required(CONF_PHASE_SENSOR_VOLTAGE): EntitySelector(
+                EntitySelectorConfig(
+                    multiple=False,
+                    domain="sensor",
+                    device_class=[SensorDeviceClass.VOLTAGE],
+                )
+            ),
+        }
+    ),
+    # Whether or not the section is initially collapsed (default = False)
+    {"collapsed": False},
+)
+
 
 async def validate_init_input(
     _hass: HomeAssistant, data: dict[str, Any]
@@ -111,44 +149,15 @@ async def validate_power_input(
     return data
 
 
+@lru_cache(maxsize=4)
 def create_phase_power_data_schema(phase_count: int) -> vol.Schema:
     """Create a schema for the power collection step based on the phase count."""
     extra_schema = {}
 
     # Limit through each of CONF_PHASE_SENSORS and limit by phase_count
-    for phase_key in [CONF_PHASE_KEY_ONE, CONF_PHASE_KEY_TWO, CONF_PHASE_KEY_THREE][
-        : int(phase_count)
-    ]:
+    for phase_key in _PHASE_KEYS[:phase_count]:
         # Create a section for each phase
-        extra_schema[vol.Required(phase_key)] = section(
-            vol.Schema(
-                {
-                    vol.Required(CONF_PHASE_SENSOR_CONSUMPTION): EntitySelector(
-                        EntitySelectorConfig(
-                            multiple=False,
-                            domain="sensor",
-                            device_class=[SensorDeviceClass.POWER],
-                        )
-                    ),
-                    vol.Required(CONF_PHASE_SENSOR_PRODUCTION): EntitySelector(
-                        EntitySelectorConfig(
-                            multiple=False,
-                            domain="sensor",
-                            device_class=[SensorDeviceClass.POWER],
-                        )
-                    ),
-                    vol.Required(CONF_PHASE_SENSOR_VOLTAGE): EntitySelector(
-                        EntitySelectorConfig(
-                            multiple=False,
-                            domain="sensor",
-                            device_class=[SensorDeviceClass.VOLTAGE],
-                        )
-                    ),
-                }
-            ),
-            # Whether or not the section is initially collapsed (default = False)
-            {"collapsed": False},
-        )
+        extra_schema[vol.Required(phase_key)] = _PHASE_SECTION_SCHEMA
 
     return vol.Schema(STEP_POWER_DATA_SCHEMA | extra_schema)
 
@@ -159,12 +168,10 @@ class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
     MINOR_VERSION = 1
 
-    cf_data: dict | None = None
-
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the config flow."""
         super().__init__(*args, **kwargs)
-        self.cf_data = {}
+        self.cf_data: dict[str, Any] = {}
 
     @staticmethod
     @callback
@@ -172,8 +179,7 @@ class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
         config_entry: ConfigEntry,
     ) -> EvseLoadBalancerOptionsFlow:
         """Get the options flow for this handler."""
-        # see https://developers.home-assistant.io/blog/2024/11/12/options-flow/
-        if parse_version(ha_version) < parse_version("2024.11.0"):
+        if not _HA_HAS_MODERN_OPTIONS_FLOW:
             return EvseLoadBalancerOptionsFlow(config_entry=config_entry)
 
         return EvseLoadBalancerOptionsFlow()
@@ -222,7 +228,7 @@ class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="power",
             data_schema=create_phase_power_data_schema(
-                phase_count=self.cf_data.get(CONF_PHASE_COUNT, 1)
+                phase_count=int(self.cf_data.get(CONF_PHASE_COUNT, 1))
             ),
             errors=errors,
         )
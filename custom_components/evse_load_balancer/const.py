@@ -1,6 +1,6 @@
 """Constants for the evse-load-balancer integration."""
 
-from enum import Enum
+from enum import StrEnum
 
 DOMAIN = "evse_load_balancer"
 
@@ -33,9 +33,18 @@ EVENT_ATTR_ACTION = "action"
 EVENT_ATTR_NEW_LIMITS = "new_limits"
 
 
-class Phase(Enum):
+class Phase(StrEnum):
     """Enum for the phases."""
 
     L1 = "l1"
     L2 = "l2"
     L3 = "l3"
+
+
+# All phases in order. Iterating a tuple is cheaper than iterating the enum.
+ALL_PHASES: tuple[Phase, ...] = (Phase.L1, Phase.L2, Phase.L3)
+
+
+def all_phases(value: int) -> dict[Phase, int]:
+    """Return a new per-phase dict with the same value on every phase."""
+    return {Phase.L1: value, Phase.L2: value, Phase.L3: value}
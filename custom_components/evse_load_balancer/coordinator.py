@@ -1,23 +1,29 @@
 """Main coordinator for load balacer."""
 
 import logging
-from datetime import datetime, timedelta  # Ensure datetime is imported
+from datetime import datetime  # Ensure datetime is imported
 from functools import cached_property
 from math import floor
 from time import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
+from homeassistant.util import dt as dt_util
 
 from . import config_flow as cf
 from . import options_flow as of
 from .balancers.optimised_load_balancer import OptimisedLoadBalancer
 from .chargers.charger import Charger
 from .const import (
+    ALL_PHASES,
     COORDINATOR_STATE_AWAITING_CHARGER,
     COORDINATOR_STATE_MONITORING_LOAD,
     DOMAIN,
@@ -29,11 +35,20 @@ from .const import (
 from .meters.meter import Meter, Phase
 from .power_allocator import PowerAllocator
 
+if TYPE_CHECKING:
+    import asyncio
+
 _LOGGER = logging.getLogger(__name__)
 
-# Number of seconds between each check cycle
+# Number of seconds between each check cycle while a charger is managed.
+# The balancer's trip risk and hold-off periods are time driven, so it has
+# to see steady meter readings too. State changes never run cycles faster.
 EXECUTION_CYCLE_DELAY: int = 1
 
+# Number of seconds between two cycles without a charger to manage. Meter and
+# charger state changes run a cycle sooner, e.g. when a car gets connected.
+FALLBACK_CYCLE_DELAY: int = 30
+
 # Number of seconds between each charger update. This setting
 # makes sure that the charger is not updated too frequently and
 # allows a change of the charger's limit to actually take affect
@@ -58,29 +73,47 @@ class EVSELoadBalancerCoordinator:
         self.hass: HomeAssistant = hass
         self.config_entry: ConfigEntry = config_entry
         self._unsub: list[CALLBACK_TYPE] = []
-        self._sensors: list[SensorEntity] = []
+        self._update_cycle_timer: asyncio.TimerHandle | None = None
+        # Loop time at which the last update cycle ran
+        self._last_cycle_time: float | None = None
+        self._sensors: set[SensorEntity] = set()
+        # Last value written to hass per sensor
+        self._sensor_values: dict[SensorEntity, Any] = {}
 
         self._meter: Meter = meter
         self._charger: Charger = charger
+        # The charger id is derived from its config entry and never changes
+        self._charger_id: str = charger.id
 
         self._previous_current_availability: dict[Phase, int] | None = None
+        # Limits held back by the update delay, and the timer applying them
+        self._pending_limits: dict[Phase, int] | None = None
+        self._pending_limits_unsub: CALLBACK_TYPE | None = None
+        self._pending_limits_due: float = 0.0
+        # Background task writing the last target to the charger
+        self._charger_update_task: asyncio.Task | None = None
+
+        # Options changes reload the config entry, which creates a new
+        # coordinator, so these stay valid for the coordinator's lifetime.
+        # The available phases follow the configured phase count (1 or 3).
+        phase_count = int(config_entry.data.get(cf.CONF_PHASE_COUNT, 3))
+        self._available_phases: tuple[Phase, ...] = ALL_PHASES[:phase_count]
+        self._fuse_size: int = self._read_fuse_size(config_entry)
+        self._charge_limit_hysteresis: int = (
+            of.EvseLoadBalancerOptionsFlow.get_option_value(
+                config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
+            )
+        )
 
     async def async_setup(self) -> None:
         """Set up the coordinator and its managed components."""
         await self._charger.async_setup()
 
-        self._unsub.append(
-            async_track_time_interval(
-                self.hass,
-                self._execute_update_cycle,
-                timedelta(seconds=EXECUTION_CYCLE_DELAY),
-            )
-        )
         self._unsub.append(
             self.config_entry.add_update_listener(self._handle_options_update)
         )
 
-        max_limits = dict.fromkeys(self._available_phases, self.fuse_size)
+        max_limits = dict.fromkeys(self._available_phases, self._fuse_size)
         self._balancer_algo = OptimisedLoadBalancer(
             max_limits=max_limits,
         )
@@ -88,14 +121,73 @@ class EVSELoadBalancerCoordinator:
         self._power_allocator = PowerAllocator()
         self._power_allocator.add_charger(charger=self._charger)
 
+        self._unsub.append(
+            async_track_state_change_event(
+                self.hass,
+                [
+                    *self._meter.get_tracking_entities(),
+                    *self._charger.get_tracking_entities(),
+                ],
+                self._handle_source_state_change,
+            )
+        )
+        self._schedule_update_cycle(EXECUTION_CYCLE_DELAY)
+
     async def async_unload(self) -> None:
         """Unload the coordinator and its managed components."""
         await self._charger.async_unload()
 
+        if self._update_cycle_timer is not None:
+            self._update_cycle_timer.cancel()
+            self._update_cycle_timer = None
+        self._cancel_pending_limits()
+
         for unsub_method in self._unsub:
             unsub_method()
         self._unsub.clear()
 
+    @callback
+    def _handle_source_state_change(self, _event: Event) -> None:
+        """Run an update cycle soon after a meter or charger entity changed."""
+        # Cycles run at most once per EXECUTION_CYCLE_DELAY, so a cycle that is
+        # already due by then picks up the change. This also coalesces the
+        # burst of per-phase state changes a meter writes into a single cycle
+        now = self.hass.loop.time()
+        run_at = now
+        if self._last_cycle_time is not None:
+            run_at = max(now, self._last_cycle_time + EXECUTION_CYCLE_DELAY)
+        timer = self._update_cycle_timer
+        if timer is not None and timer.when() <= run_at:
+            return
+        self._schedule_update_cycle(run_at - now)
+
+    @callback
+    def _schedule_update_cycle(self, delay: float) -> None:
+        """
+        Arm the timer for the next update cycle, replacing a pending one.
+
+        A bare loop timer avoids the job wrapping and interval bookkeeping
+        of async_track_time_interval.
+        """
+        if self._update_cycle_timer is not None:
+            self._update_cycle_timer.cancel()
+        loop = self.hass.loop
+        self._update_cycle_timer = loop.call_at(
+            loop.time() + delay, self._run_update_cycle
+        )
+
+    @callback
+    def _run_update_cycle(self) -> None:
+        """Run an update cycle from the loop timer."""
+        self._last_cycle_time = self.hass.loop.time()
+        # Re-arm first so a failing cycle doesn't stop balancing
+        self._schedule_update_cycle(
+            EXECUTION_CYCLE_DELAY
+            if self._should_check_charger()
+            else FALLBACK_CYCLE_DELAY
+        )
+        self._execute_update_cycle(dt_util.utcnow())
+
     @cached_property
     def _device(self) -> dr.DeviceEntry:
         """Get the device entry for the coordinator."""
@@ -111,6 +203,11 @@ class EVSELoadBalancerCoordinator:
             raise RuntimeError(msg)
         return device
 
+    @cached_property
+    def _event_base(self) -> dict[str, Any]:
+        """Get the event payload fields that are the same for every event."""
+        return {ATTR_DEVICE_ID: self._device.id}
+
     async def _handle_options_update(
         self,
         hass: HomeAssistant,
@@ -120,37 +217,39 @@ class EVSELoadBalancerCoordinator:
         await hass.config_entries.async_reload(entry.entry_id)
 
     def register_sensor(self, sensor: SensorEntity) -> None:
-        """Register a sensor to be updated by the coordinator."""
-        if sensor not in self._sensors:
-            self._sensors.append(sensor)
+        """Register a sensor that has been added to hass to be updated."""
+        self._sensors.add(sensor)
 
     def unregister_sensor(self, sensor: SensorEntity) -> None:
         """Unregister a sensor."""
-        if sensor in self._sensors:
-            self._sensors.remove(sensor)
+        self._sensors.discard(sensor)
+        self._sensor_values.pop(sensor, None)
 
-    @property
-    def fuse_size(self) -> int:
+    @staticmethod
+    def _read_fuse_size(config_entry: ConfigEntry) -> int:
         """
-        Get the effective fuse size for load balancing.
+        Read the effective fuse size for load balancing.
 
         Considers the main fuse size from initial setup (config_entry.data)
         and the optional override from the integration's options (config_entry.options).
         """
-        config_fuse_amps = self.config_entry.data.get(cf.CONF_FUSE_SIZE, 0)
-        options_fuse_amps = self.config_entry.options.get(
-            of.OPTION_MAX_FUSE_LOAD_AMPS, None
-        )
+        config_fuse_amps = config_entry.data.get(cf.CONF_FUSE_SIZE, 0)
+        options_fuse_amps = config_entry.options.get(of.OPTION_MAX_FUSE_LOAD_AMPS, None)
 
         return int(
             options_fuse_amps if options_fuse_amps is not None else config_fuse_amps
         )
 
+    @property
+    def fuse_size(self) -> int:
+        """Get the effective fuse size for load balancing."""
+        return self._fuse_size
+
     def get_available_current_for_phase(self, phase: Phase) -> int | None:
         """Get the available current for a given phase."""
         active_current = self._meter.get_active_phase_current(phase)
         return (
-            min(self.fuse_size, floor(self.fuse_size - active_current))
+            min(self._fuse_size, floor(self._fuse_size - active_current))
             if active_current is not None
             else None
         )
@@ -170,13 +269,6 @@ class EVSELoadBalancerCoordinator:
             available_currents[phase_obj] = current
         return available_currents
 
-    @cached_property
-    def _available_phases(self) -> list[Phase]:
-        """Get the available phases based on the user's configuration (1 or 3 phase)."""
-        # Assumes CONF_PHASE_COUNT is stored in config_entry.data
-        phase_count = int(self.config_entry.data.get(cf.CONF_PHASE_COUNT, 3))
-        return list(Phase)[:phase_count]
-
     @property
     def get_load_balancing_state(self) -> str:
         """Get the current load balancing state."""
@@ -192,7 +284,15 @@ class EVSELoadBalancerCoordinator:
     @callback
     def _execute_update_cycle(self, now: datetime) -> None:
         """Execute the main update cycle for load balancing."""
-        self._last_check_timestamp = datetime.now().astimezone()
+        # The scheduler hands in an aware UTC datetime already
+        self._last_check_timestamp = now
+
+        # Without a charger to manage, the balancer doesn't need the meter
+        # readings; the sensors read their own values
+        if not self._should_check_charger():
+            self._async_update_sensors()
+            return
+
         available_currents = self._get_available_currents()
 
         self._async_update_sensors()
@@ -201,15 +301,14 @@ class EVSELoadBalancerCoordinator:
             _LOGGER.warning("Available current unknown. Cannot adjust limit.")
             return
 
-        # Run the actual charger update
-        if not self._should_check_charger():
-            return
-
         # Computes relative limit. Negative in case of overcurrent
-        # and positive in case of availability
+        # and positive in case of availability. The balancer and allocator
+        # only do a few comparisons per phase, so they run inline on the
+        # event loop; an executor job would cost more than the work itself
+        timestamp = now.timestamp()
         computed_availability = self._balancer_algo.compute_availability(
             available_currents=available_currents,
-            now=now.timestamp(),
+            now=timestamp,
         )
 
         if not self._should_act_upon_availability(currents=computed_availability):
@@ -223,72 +322,144 @@ class EVSELoadBalancerCoordinator:
         # the coordinator only supports one charger. So we need to
         # iterate over the allocation results and update the charger
         # with the results. Just a bit of prep for the future...
-        allocation_result = allocation_results.get(self._charger.id, None)
-        if allocation_result and self._may_update_charger_settings(allocation_result):
-            self._update_charger_settings(allocation_result)
-            self._power_allocator.update_applied_current(
-                charger_id=self._charger.id,
-                applied_current=allocation_result,
-                timestamp=now.timestamp(),
-            )
+        allocation_result = allocation_results.get(self._charger_id)
+        if not allocation_result or self._is_last_charger_target(allocation_result):
+            # Nothing to change anymore, so limits waiting on the delay are stale
+            self._cancel_pending_limits()
+            return
+
+        if self._may_update_charger_settings(allocation_result):
+            self._apply_charger_settings(allocation_result, timestamp)
+        else:
+            self._defer_charger_settings(allocation_result)
 
     def _should_act_upon_availability(self, currents: dict[Phase, int]) -> bool:
         """Check if any of the current values have changed and should be acted upon."""
-        if self._previous_current_availability is None:
-            self._previous_current_availability = currents
-            return True
-
-        previous = self._previous_current_availability
-        if any(previous[p] != current for p, current in currents.items()):
-            self._previous_current_availability = currents
-            return True
+        # Both dicts hold the same configured phases, so a single dict
+        # comparison replaces the per-phase generator
+        if currents == self._previous_current_availability:
+            return False
 
-        return False
+        self._previous_current_availability = currents
+        return True
 
     def _async_update_sensors(self) -> None:
-        """Update all registered sensor states."""
+        """Write the state of registered sensors whose value changed."""
+        # Only sensors added to hass are registered, so no enabled/hass check
+        sensor_values = self._sensor_values
         for sensor in self._sensors:
-            if sensor.enabled and sensor.hass:
-                sensor.async_write_ha_state()
+            value = sensor.native_value
+            if sensor in sensor_values and sensor_values[sensor] == value:
+                continue
+            sensor_values[sensor] = value
+            sensor.async_write_ha_state()
 
     def _should_check_charger(self) -> bool:
         """Check if the charger is in a state where its limit should be managed."""
         return self._power_allocator.should_monitor()
 
-    def _may_update_charger_settings(self, new_settings: dict[Phase, int]) -> bool:
-        """Check if the charger settings haven't been updated too recently."""
+    def _is_last_charger_target(self, new_settings: dict[Phase, int]) -> bool:
+        """Check if the settings equal a recent write that may still take effect."""
         if self._last_charger_target_update is None:
+            return False
+
+        last_charger_target, last_update_time = self._last_charger_target_update
+        if last_charger_target != new_settings:
+            return False
+
+        # The allocator only proposes limits the charger doesn't report yet.
+        # While the write runs, or within the update delay, that's expected;
+        # afterwards the write failed or was overridden and is sent again
+        task = self._charger_update_task
+        if task is not None and not task.done():
             return True
+        return int(time()) - last_update_time <= MIN_CHARGER_UPDATE_DELAY
+
+    def _charger_update_delay(self, new_settings: dict[Phase, int]) -> int:
+        """Return the number of seconds until the settings may be sent."""
+        if self._last_charger_target_update is None:
+            return 0
 
         last_charger_target, last_update_time = self._last_charger_target_update
-        now = int(time())
+        if any(new_settings[p] < last_charger_target[p] for p in new_settings):
+            # Lower settings are applied ignoring the user's hysteresis setting
+            required_delay = MIN_CHARGER_UPDATE_DELAY
+        else:
+            required_delay = max(
+                MIN_CHARGER_UPDATE_DELAY, self._charge_limit_hysteresis * 60
+            )
 
-        of_charger_delay_minutes = of.EvseLoadBalancerOptionsFlow.get_option_value(
-            self.config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
-        )
+        # The required delay has to be strictly exceeded
+        return max(0, last_update_time + required_delay + 1 - int(time()))
 
-        if now - last_update_time > MIN_CHARGER_UPDATE_DELAY:
-            if any(new_settings[p] < last_charger_target[p] for p in new_settings):
-                _LOGGER.debug(
-                    "New charger settings are lower, apply ignoring user setting. "
-                    "Last settings: %s, new settings: %s",
-                    last_charger_target,
-                    new_settings,
-                )
-                return True
+    def _may_update_charger_settings(self, new_settings: dict[Phase, int]) -> bool:
+        """Check if the charger settings haven't been updated too recently."""
+        delay = self._charger_update_delay(new_settings)
+        if delay == 0:
+            return True
+
+        # Hit on every proposal while throttled, so skip the call when filtered
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Charger settings was updated too recently. "
+                "Retrying in %s seconds. Configured delay: %s minutes",
+                delay,
+                self._charge_limit_hysteresis,
+            )
+        return False
 
-            if now - last_update_time > (of_charger_delay_minutes * 60):
-                return True
+    def _apply_charger_settings(
+        self, new_limits: dict[Phase, int], timestamp: float
+    ) -> None:
+        """Send new limits to the charger and record them with the allocator."""
+        self._cancel_pending_limits()
+        self._update_charger_settings(new_limits)
+        self._power_allocator.update_applied_current(
+            charger_id=self._charger_id,
+            applied_current=new_limits,
+            timestamp=timestamp,
+        )
 
-        _LOGGER.debug(
-            "Charger settings was updated too recently. "
-            "Last update: %s, current time: %s. "
-            "Configured delay: %s minutes",
-            last_update_time,
-            int(time()),
-            of_charger_delay_minutes,
+    def _defer_charger_settings(self, new_limits: dict[Phase, int]) -> None:
+        """Keep throttled limits and apply them once the delay has passed."""
+        # Later proposals replace the pending limits. The timer is only
+        # re-armed when they may be applied sooner, e.g. a reduction following
+        # an increase that waits for the full hysteresis delay
+        self._pending_limits = new_limits
+        delay = self._charger_update_delay(new_limits)
+        due = time() + delay
+        if self._pending_limits_unsub is not None:
+            if due >= self._pending_limits_due:
+                return
+            self._pending_limits_unsub()
+        self._pending_limits_due = due
+        self._pending_limits_unsub = async_call_later(
+            self.hass, delay, self._flush_pending_limits
         )
-        return False
+
+    @callback
+    def _flush_pending_limits(self, _now: datetime) -> None:
+        """Apply the pending limits once the update delay has passed."""
+        self._pending_limits_unsub = None
+        pending_limits = self._pending_limits
+        if pending_limits is None:
+            return
+
+        if not self._should_check_charger():
+            self._pending_limits = None
+            return
+
+        if self._may_update_charger_settings(pending_limits):
+            self._apply_charger_settings(pending_limits, time())
+        else:
+            self._defer_charger_settings(pending_limits)
+
+    def _cancel_pending_limits(self) -> None:
+        """Drop pending limits and their timer."""
+        self._pending_limits = None
+        if self._pending_limits_unsub is not None:
+            self._pending_limits_unsub()
+            self._pending_limits_unsub = None
 
     def _update_charger_settings(self, new_limits: dict[Phase, int]) -> None:
         _LOGGER.debug("New charger settings: %s", new_limits)
@@ -297,18 +468,20 @@ class EVSELoadBalancerCoordinator:
             int(time()),
         )
         self._emit_charger_event(EVENT_ACTION_NEW_CHARGER_LIMITS, new_limits)
-        self.hass.async_create_task(self._charger.set_current_limit(new_limits))
+        # Runs eagerly up to the first await, so a write the charger can skip
+        # finishes without a trip through the scheduler
+        self._charger_update_task = self.hass.async_create_background_task(
+            self._charger.set_current_limit(new_limits),
+            name=f"{DOMAIN}_set_current_limit",
+            eager_start=True,
+        )
 
     def _emit_charger_event(self, action: str, new_limits: dict[Phase, int]) -> None:
         """Emit an event to Home Assistant's device event log."""
-        self.hass.bus.async_fire(
-            EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
-            {
-                ATTR_DEVICE_ID: self._device.id,
-                EVENT_ATTR_ACTION: action,
-                EVENT_ATTR_NEW_LIMITS: new_limits,
-            },
-        )
+        payload = self._event_base.copy()
+        payload[EVENT_ATTR_ACTION] = action
+        payload[EVENT_ATTR_NEW_LIMITS] = new_limits
+        self.hass.bus.async_fire(EVSE_LOAD_BALANCER_COORDINATOR_EVENT, payload)
         _LOGGER.info(
             "Emitted charger event: action=%s, new_limits=%s", action, new_limits
         )
@@ -6,6 +6,7 @@ class ValidationExceptionError(Exception):
 
     def __init__(self, base: str, key: str) -> None:
         """Initialize ValidationException with a message."""
-        super().__init__("Validation Exception for #{base} and #{key}")
+        msg = f"Validation Exception for {base} and {key}"
+        super().__init__(msg)
         self.base = base
         self.key = key
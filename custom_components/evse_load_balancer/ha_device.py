@@ -29,7 +29,21 @@ class HaDevice:
 
     def refresh_entities(self) -> None:
         """Refresh local list of entity maps for the meter."""
-        self._entities = self._get_entities_for_device()
+        self._get_entities_for_device()
+
+        # Index entities by translation key and unique id once, so per-tick
+        # state lookups don't have to scan the device's entity list.
+        self._entities_by_translation_key: dict[str, RegistryEntry] = {}
+        self._entities_by_unique_id: dict[str, RegistryEntry] = {}
+        for entity in self.entities:
+            if entity.translation_key is not None:
+                self._entities_by_translation_key.setdefault(
+                    entity.translation_key, entity
+                )
+            self._entities_by_unique_id.setdefault(entity.unique_id, entity)
+        # Keys can contain underscores themselves, so suffix matches can't be
+        # indexed up front and are memoized on first lookup instead.
+        self._entities_by_key: dict[str, RegistryEntry] = {}
 
     def _get_entities_for_device(self) -> None:
         """Get all available entities for the linked HA device."""
@@ -40,9 +54,8 @@ class HaDevice:
 
     def _get_entity_id_by_translation_key(self, entity_translation_key: str) -> str:
         """Get the entity ID for a given translation key."""
-        entity: RegistryEntry | None = next(
-            (e for e in self.entities if e.translation_key == entity_translation_key),
-            None,
+        entity: RegistryEntry | None = self._entities_by_translation_key.get(
+            entity_translation_key
         )
         if entity is None:
             msg = f"Entity not found for translation_key '{entity_translation_key}'"
@@ -55,10 +68,7 @@ class HaDevice:
 
     def _get_entity_id_by_unique_id(self, entity_unique_id: str) -> str | None:
         """Get the entity ID for a given unique ID."""
-        entity: RegistryEntry | None = next(
-            (e for e in self.entities if e.unique_id == entity_unique_id),
-            None,
-        )
+        entity: RegistryEntry | None = self._entities_by_unique_id.get(entity_unique_id)
         if entity is None:
             msg = f"Entity not found for unique_id '{entity_unique_id}'"
             raise ValueError(msg)
@@ -68,20 +78,24 @@ class HaDevice:
             )
         return entity.entity_id
 
-    def _get_entity_id_by_key(self, entity_key: str) -> float | None:
+    def _get_entity_id_by_key(self, entity_key: str) -> str:
         """
         Get the entity ID for a given key.
 
         Looks up the entity by checking all entities associated with the device
         whose unique_id end with the provided key.
         """
-        entity: RegistryEntry | None = next(
-            (e for e in self.entities if e.unique_id.endswith(f"_{entity_key}")),
-            None,
-        )
+        entity: RegistryEntry | None = self._entities_by_key.get(entity_key)
         if entity is None:
-            msg = f"Entity with unique_id ending with '{entity_key}' not found"
-            raise ValueError(msg)
+            suffix = f"_{entity_key}"
+            entity = next(
+                (e for e in self.entities if e.unique_id.endswith(suffix)),
+                None,
+            )
+            if entity is None:
+                msg = f"Entity with unique_id ending with '{entity_key}' not found"
+                raise ValueError(msg)
+            self._entities_by_key[entity_key] = entity
         if entity.disabled:
             _LOGGER.error(
                 "Required entity %s is disabled. Please enable it!", entity.entity_id
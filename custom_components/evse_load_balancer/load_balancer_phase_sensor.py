@@ -1,7 +1,6 @@
 """EVSE Load Balancer sensor platform."""
 
 import logging
-from functools import cached_property
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
 from homeassistant.components.sensor.const import UnitOfElectricCurrent
@@ -21,6 +20,12 @@ SENSOR_KEY_AVAILABLE_CURRENT_L1 = "available_current_l1"
 SENSOR_KEY_AVAILABLE_CURRENT_L2 = "available_current_l2"
 SENSOR_KEY_AVAILABLE_CURRENT_L3 = "available_current_l3"
 
+_PHASE_BY_SENSOR_KEY: dict[str, Phase] = {
+    SENSOR_KEY_AVAILABLE_CURRENT_L1: Phase.L1,
+    SENSOR_KEY_AVAILABLE_CURRENT_L2: Phase.L2,
+    SENSOR_KEY_AVAILABLE_CURRENT_L3: Phase.L3,
+}
+
 
 class LoadBalancerPhaseSensor(LoadBalancerSensor):
     """Representation of a EVSE Load Balancer sensor."""
@@ -31,12 +36,15 @@ class LoadBalancerPhaseSensor(LoadBalancerSensor):
         entity_description: SensorEntityDescription,
     ) -> None:
         """Initialize the LoadBalancerPhaseSensor."""
+        phase = _PHASE_BY_SENSOR_KEY.get(entity_description.key)
+        if phase is None:
+            msg = f"No phase for invalid sensor key: {entity_description.key}"
+            raise ValueError(msg)
         super().__init__(coordinator, entity_description)
+        self._phase: Phase = phase
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
 
-        coordinator.register_sensor(self)
-
     @property
     def native_value(self) -> int | None:
         """Return the available current from the coordinator."""
@@ -44,23 +52,9 @@ class LoadBalancerPhaseSensor(LoadBalancerSensor):
             return self._coordinator.get_available_current_for_phase(self._phase)
 
         _LOGGER.error(
-            (
-                f"Cant get sensor value. Sensor {self.entity_description.key}",
-                "has an invalid device class: {self.entity_description.device_class}.",
-            )
+            "Cant get sensor value. Sensor %s has an invalid device class: %s.",
+            self.entity_description.key,
+            self.entity_description.device_class,
         )
 
         return None
-
-    @cached_property
-    def _phase(self) -> Phase:
-        """Return the phase for the sensor."""
-        key = self.entity_description.key
-        if key in [SENSOR_KEY_AVAILABLE_CURRENT_L1]:
-            return Phase.L1
-        if key in [SENSOR_KEY_AVAILABLE_CURRENT_L2]:
-            return Phase.L2
-        if key in [SENSOR_KEY_AVAILABLE_CURRENT_L3]:
-            return Phase.L3
-        msg = f"No phase for invalid sensor key: {key}"
-        raise ValueError(msg)
@@ -41,8 +41,6 @@ class LoadBalancerSensor(SensorEntity):
             ),
         )
 
-        coordinator.register_sensor(self)
-
     @property
     def native_value(self) -> any:
         """Return the value of the sensor."""
@@ -51,12 +49,19 @@ class LoadBalancerSensor(SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.state is not None
+        # native_value is None exactly when state is, without the unit and
+        # device class handling SensorEntity.state does on top of it
+        return self.native_value is not None
 
     def _get_value_from_coordinator(self) -> any:
         """Override in subclass or implement coordinator lookup based on key."""
         return getattr(self._coordinator, self.entity_description.key, None)
 
+    async def async_added_to_hass(self) -> None:
+        """Register the sensor with the coordinator once it is added."""
+        await super().async_added_to_hass()
+        self._coordinator.register_sensor(self)
+
     async def async_will_remove_from_hass(self) -> None:
         """Unregister the sensor from the coordinator."""
         self._coordinator.unregister_sensor(self)
@@ -24,21 +24,31 @@ class CustomMeter(Meter):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the Custom Meter instance."""
         Meter.__init__(self, hass, config_entry)
-        self._config_entry_data = config_entry.data
+        # (consumption, production, voltage) entity ids per configured phase.
+        # Phases beyond the configured phase count have no sensors.
+        self._phase_sensors: dict[Phase, tuple[str, str, str]] = {}
+        for phase, phase_cf in PHASE_CONF_MAP.items():
+            phase_config = config_entry.data.get(phase_cf)
+            if phase_config is not None:
+                self._phase_sensors[phase] = (
+                    phase_config[cf.CONF_PHASE_SENSOR_CONSUMPTION],
+                    phase_config[cf.CONF_PHASE_SENSOR_PRODUCTION],
+                    phase_config[cf.CONF_PHASE_SENSOR_VOLTAGE],
+                )
 
     def get_active_phase_current(self, phase: Phase) -> int | None:
         """Return available current on a given phase."""
-        phase_config = self._config_entry_data.get(PHASE_CONF_MAP[phase], None)
-        if phase_config is None:
+        phase_sensors = self._phase_sensors.get(phase)
+        if phase_sensors is None:
             return None
 
         active_power = self.get_active_phase_power(phase)
-        voltage_state = self._get_state(phase_config[cf.CONF_PHASE_SENSOR_VOLTAGE])
-        if None in [active_power, voltage_state]:
+        voltage_state = self._get_state(phase_sensors[2])
+        if active_power is None or voltage_state is None:
             _LOGGER.warning(
                 (
-                    "Missing states for one of phase %s: active_power: %s,",
-                    " voltage_state: %s. Are the entities enabled?",
+                    "Missing states for one of phase %s: active_power: %s, "
+                    "voltage_state: %s. Are the entities enabled?"
                 ),
                 phase,
                 active_power,
@@ -49,10 +59,10 @@ class CustomMeter(Meter):
 
     def get_active_phase_power(self, phase: Phase) -> float | None:
         """Return the active power on a given phase."""
-        phase_config = self._config_entry_data[PHASE_CONF_MAP[phase]]
-        consumption = self._get_state(phase_config[cf.CONF_PHASE_SENSOR_CONSUMPTION])
-        production = self._get_state(phase_config[cf.CONF_PHASE_SENSOR_PRODUCTION])
-        if None in [consumption, production]:
+        consumption_id, production_id, _ = self._phase_sensors[phase]
+        consumption = self._get_state(consumption_id)
+        production = self._get_state(production_id)
+        if consumption is None or production is None:
             _LOGGER.warning(
                 (
                     "Missing states for one of phase %s: consumption: %s, "
@@ -67,15 +77,11 @@ class CustomMeter(Meter):
 
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
-        sensors = []
-        for phase_cf in PHASE_CONF_MAP.values():
-            for cf_sensor in [
-                cf.CONF_PHASE_SENSOR_CONSUMPTION,
-                cf.CONF_PHASE_SENSOR_PRODUCTION,
-                cf.CONF_PHASE_SENSOR_VOLTAGE,
-            ]:
-                sensors.extend(self._config_entry_data[phase_cf][cf_sensor])
-        return sensors
+        return [
+            entity_id
+            for phase_sensors in self._phase_sensors.values()
+            for entity_id in phase_sensors
+        ]
 
     def _get_state(self, entity_id: str) -> float | None:
         state = self.hass.states.get(entity_id)
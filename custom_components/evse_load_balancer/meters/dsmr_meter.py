@@ -35,6 +35,13 @@ ENTITY_REGISTRATION_MAP: dict[str, dict[str, str]] = {
     },
 }
 
+# ENTITY_REGISTRATION_MAP keyed by phase, so a phase lookup is a single dict hit
+_PHASE_ENTITY_MAP: dict[Phase, dict[str, str]] = {
+    Phase.L1: ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_ONE],
+    Phase.L2: ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_TWO],
+    Phase.L3: ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_THREE],
+}
+
 
 class DsmrMeter(Meter, HaDevice):
     """DSMR Meter implementation of the Meter class."""
@@ -54,11 +61,11 @@ class DsmrMeter(Meter, HaDevice):
             phase, cf.CONF_PHASE_SENSOR_VOLTAGE
         )
 
-        if None in [active_power, voltage_state]:
+        if active_power is None or voltage_state is None:
             _LOGGER.warning(
                 (
-                    "Missing states for one of phase %s: active_power: %s, ",
-                    "voltage: %s. Are the entities enabled?",
+                    "Missing states for one of phase %s: active_power: %s, "
+                    "voltage: %s. Are the entities enabled?"
                 ),
                 phase,
                 active_power,
@@ -77,7 +84,7 @@ class DsmrMeter(Meter, HaDevice):
             phase, cf.CONF_PHASE_SENSOR_PRODUCTION
         )
 
-        if None in [consumption_state, production_state]:
+        if consumption_state is None or production_state is None:
             _LOGGER.warning(
                 "Missing states for one of phase %s: consumption: %s, production: %s",
                 phase,
@@ -116,14 +123,8 @@ class DsmrMeter(Meter, HaDevice):
         return self._get_entity_state(entity_id, float)
 
     def _get_entity_map_for_phase(self, phase: Phase) -> dict:
-        entity_map = {}
-        if phase == Phase.L1:
-            entity_map = ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_ONE]
-        elif phase == Phase.L2:
-            entity_map = ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_TWO]
-        elif phase == Phase.L3:
-            entity_map = ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_THREE]
-        else:
+        entity_map = _PHASE_ENTITY_MAP.get(phase)
+        if entity_map is None:
             msg = f"Invalid phase: {phase}"
             raise ValueError(msg)
         return entity_map
@@ -32,6 +32,18 @@ HOMEWIZARD_ENTITY_MAP: dict[str, dict[str, str]] = {
     },
 }
 
+# HOMEWIZARD_ENTITY_MAP keyed by phase, so a phase lookup is a single dict hit
+_PHASE_ENTITY_MAP: dict[Phase, dict[str, str]] = {
+    Phase.L1: HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_ONE],
+    Phase.L2: HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_TWO],
+    Phase.L3: HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_THREE],
+}
+
+# Unique id suffixes of all tracked entities, for a single str.endswith call
+_TRACKED_SUFFIXES: tuple[str, ...] = tuple(
+    f"_{key}" for phase in HOMEWIZARD_ENTITY_MAP.values() for key in phase.values()
+)
+
 
 class HomeWizardMeter(Meter, HaDevice):
     """HomeWizard P1 Meter implementation of the Meter class."""
@@ -50,11 +62,11 @@ class HomeWizardMeter(Meter, HaDevice):
         voltage_state = self._get_entity_state_for_phase_sensor(
             phase, cf.CONF_PHASE_SENSOR_VOLTAGE
         )
-        if None in [active_power, voltage_state]:
+        if active_power is None or voltage_state is None:
             _LOGGER.warning(
                 (
-                    "Missing states for one of phase %s: active_power: %s, ",
-                    "voltage: %s. Are the entities enabled?",
+                    "Missing states for one of phase %s: active_power: %s, "
+                    "voltage: %s. Are the entities enabled?"
                 ),
                 phase,
                 active_power,
@@ -84,20 +96,13 @@ class HomeWizardMeter(Meter, HaDevice):
 
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
-        keys = [
-            entity
-            for phase in HOMEWIZARD_ENTITY_MAP.values()
-            for entity in phase.values()
-        ]
         return [
             e.entity_id
             for e in self.entities
-            if any(e.unique_id.endswith(f"_{key}") for key in keys)
+            if e.unique_id.endswith(_TRACKED_SUFFIXES)
         ]
 
-    def _get_entity_id_for_phase_sensor(
-        self, phase: Phase, sensor_const: str
-    ) -> float | None:
+    def _get_entity_id_for_phase_sensor(self, phase: Phase, sensor_const: str) -> str:
         """Get the entity_id for a given phase and key."""
         return self._get_entity_id_by_key(
             self._get_entity_map_for_phase(phase)[sensor_const]
@@ -111,11 +116,8 @@ class HomeWizardMeter(Meter, HaDevice):
         return self._get_entity_state(entity_id, float)
 
     def _get_entity_map_for_phase(self, phase: Phase) -> dict:
-        if phase == Phase.L1:
-            return HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_ONE]
-        if phase == Phase.L2:
-            return HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_TWO]
-        if phase == Phase.L3:
-            return HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_THREE]
-        msg = f"Invalid phase: {phase}"
-        raise ValueError(msg)
+        entity_map = _PHASE_ENTITY_MAP.get(phase)
+        if entity_map is None:
+            msg = f"Invalid phase: {phase}"
+            raise ValueError(msg)
+        return entity_map
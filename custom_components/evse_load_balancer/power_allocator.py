@@ -4,7 +4,7 @@ import logging
 from math import floor
 
 from .chargers.charger import Charger
-from .const import Phase
+from .const import Phase, all_phases
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -184,7 +184,9 @@ class PowerAllocator:
                 min_new = min(new_limits.values()) if new_limits else min_current
                 has_changes = min_new != min_current
             else:
-                has_changes = any(
+                # Equal dicts are the steady state and compare in C; the
+                # per-phase walk is only needed when the key sets may differ
+                has_changes = new_limits != current_setting and any(
                     new_limits[phase] != current_setting[phase] for phase in new_limits
                 )
 
@@ -249,7 +251,7 @@ class PowerAllocator:
 
                 if processed_currents:
                     min_current = min(processed_currents.values())
-                    result[charger_id] = dict.fromkeys(Phase, min_current)
+                    result[charger_id] = all_phases(min_current)
                 else:
                     # If no phases were processed, keep the original values
                     pass
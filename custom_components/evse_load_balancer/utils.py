@@ -1,6 +1,12 @@
 """Utilities."""
 
+import logging
 from collections.abc import Callable
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+
+_LOGGER = logging.getLogger(__name__)
 
 
 def combined_conf_key(*conf_keys: list) -> str:
@@ -13,3 +19,16 @@ def get_callable_name(obj: Callable) -> str:
     if isinstance(obj, property):
         return obj.fget.__name__
     return obj.__name__
+
+
+def parse_int_state(state: Any) -> int | None:
+    """Parse a numeric entity state (e.g. "16" or "16.0") as int, or None."""
+    # Limits are read several times per cycle, so the expected non-numeric
+    # states are returned early instead of going through the exception path
+    if state is None or state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        return None
+    try:
+        return int(float(state))
+    except (ValueError, TypeError, OverflowError):
+        _LOGGER.debug("Could not convert state '%s' to number", state)
+        return None
@@ -2,8 +2,12 @@
 
 import time
 from statistics import median
+from unittest.mock import patch
 
-from custom_components.evse_load_balancer.balancers.default_load_balancer import DefaultLoadBalancer
+from custom_components.evse_load_balancer.balancers.default_load_balancer import (
+    MAX_BUFFERED_SAMPLES,
+    DefaultLoadBalancer,
+)
 from custom_components.evse_load_balancer.meters.meter import Phase
 
 # Note: Adjust the import paths as needed to match your project structure.
@@ -92,3 +96,33 @@ def test_buffered_increase():
     assert new_limits[Phase.L1] == expected_L1, f"Expected {expected_L1}, got {new_limits[Phase.L1]}"
     assert new_limits[Phase.L2] == expected_L2, f"Expected {expected_L2}, got {new_limits[Phase.L2]}"
     assert new_limits[Phase.L3] == expected_L3, f"Expected {expected_L3}, got {new_limits[Phase.L3]}"
+
+
+def test_buffer_is_bounded():
+    """Test the per-phase sample buffer never grows past its maximum size."""
+    balancer = DefaultLoadBalancer(hysteresis_period=10_000)
+    current_limits = dict.fromkeys(Phase, 16)
+    max_limits = dict.fromkeys(Phase, 32)
+    available_currents = dict.fromkeys(Phase, 2)
+
+    start_time = time.time()
+    for i in range(MAX_BUFFERED_SAMPLES + 10):
+        balancer.compute_availability(current_limits, available_currents, max_limits, now=start_time + i)
+
+    assert len(balancer._buffers[Phase.L1]) == MAX_BUFFERED_SAMPLES
+
+
+def test_apply_phase_hysteresis_window():
+    """Test the hysteresis window buffers values and flushes their median once elapsed."""
+    balancer = DefaultLoadBalancer(hysteresis_period=1)
+    module = "custom_components.evse_load_balancer.balancers.default_load_balancer.time"
+
+    with patch(module, return_value=1000):
+        assert balancer._apply_phase_hysteresis(Phase.L1, 4) is None
+        assert balancer._apply_phase_hysteresis(Phase.L1, 6) is None
+
+    with patch(module, return_value=1060):
+        assert balancer._apply_phase_hysteresis(Phase.L1, 8) == 6
+
+    assert Phase.L1 not in balancer._hysteresis_start
+    assert Phase.L1 not in balancer._hysteresis_buffer
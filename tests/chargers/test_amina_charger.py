@@ -147,7 +147,7 @@ def test_can_charge_false_other_status(amina_charger):
 
 @pytest.mark.asyncio
 async def test_set_phase_mode_single(amina_charger):
-    with patch.object(amina_charger, "_async_mqtt_publish", new=AsyncMock()) as mock_publish:
+    with patch.object(amina_charger, "_publish", new=AsyncMock()) as mock_publish:
         await amina_charger.set_phase_mode(PhaseMode.SINGLE)
         mock_publish.assert_awaited_once_with(
             topic=amina_charger._topic_set,
@@ -157,7 +157,7 @@ async def test_set_phase_mode_single(amina_charger):
 
 @pytest.mark.asyncio
 async def test_set_phase_mode_three(amina_charger):
-    with patch.object(amina_charger, "_async_mqtt_publish", new=AsyncMock()) as mock_publish:
+    with patch.object(amina_charger, "_publish", new=AsyncMock()) as mock_publish:
         await amina_charger.set_phase_mode(PhaseMode.MULTI)
         mock_publish.assert_awaited_once_with(
             topic=amina_charger._topic_set,
@@ -167,10 +167,10 @@ async def test_set_phase_mode_three(amina_charger):
 
 @pytest.mark.asyncio
 async def test_set_current_limit(amina_charger):
-    with patch.object(amina_charger, "_async_mqtt_publish", new=AsyncMock()) as mock_publish:
+    with patch.object(amina_charger, "_publish", new=AsyncMock()) as mock_publish:
         await amina_charger.set_current_limit({Phase.L1: 20, Phase.L2: 18, Phase.L3: 15})
         
-        # Check that _async_mqtt_publish was called twice
+        # Check that _publish was called twice
         assert mock_publish.call_count == 2
         
         # Check the arguments of the first call (ChargeLimit)
@@ -200,10 +200,10 @@ async def test_async_unload(amina_charger):
 
 @pytest.mark.asyncio
 async def test_set_current_limit_below_min(amina_charger):
-    with patch.object(amina_charger, "_async_mqtt_publish", new=AsyncMock()) as mock_publish:
+    with patch.object(amina_charger, "_publish", new=AsyncMock()) as mock_publish:
         await amina_charger.set_current_limit({Phase.L1: 5, Phase.L2: 4, Phase.L3: 3})
         
-        # Check that _async_mqtt_publish was called twice
+        # Check that _publish was called twice
         assert mock_publish.call_count == 2
         
         # Check the arguments of the first call (ChargeLimit)
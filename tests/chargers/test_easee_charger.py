@@ -116,6 +116,13 @@ def test_get_current_limit_missing_entity(easee_charger):
     )
 
 
+def test_get_current_limit_unavailable(easee_charger):
+    """Test retrieving the current limit when the entity is unavailable."""
+    easee_charger._get_entity_state_by_translation_key.return_value = "unavailable"
+
+    assert easee_charger.get_current_limit() is None
+
+
 def test_get_max_current_limit_success(easee_charger):
     """Test retrieving the max current limit when entity exists."""
     # Mock the entity state
@@ -237,3 +244,24 @@ def test_set_phase_mode_invalid(easee_charger):
         # Using a string instead of PhaseMode enum should raise ValueError
         easee_charger.set_phase_mode("invalid_mode", Phase.L1)
     assert "Invalid mode" in str(excinfo.value)
+
+
+def test_get_tracking_entities(easee_charger):
+    """Test the status entity is tracked so connecting a car triggers a cycle."""
+    easee_charger._get_entity_id_by_translation_key = MagicMock(
+        return_value="sensor.easee_status"
+    )
+
+    assert easee_charger.get_tracking_entities() == ["sensor.easee_status"]
+    easee_charger._get_entity_id_by_translation_key.assert_called_once_with(
+        EaseeEntityMap.Status
+    )
+
+
+def test_get_tracking_entities_missing_status_entity(easee_charger):
+    """Test a missing status entity is not tracked instead of failing setup."""
+    easee_charger._get_entity_id_by_translation_key = MagicMock(
+        side_effect=ValueError("Entity not found for translation_key 'status'")
+    )
+
+    assert easee_charger.get_tracking_entities() == []
@@ -85,6 +85,18 @@ def test_compose_unique_id(keba_charger):
     assert unique_id == "keba_wallbox_abc123_max_current"
 
 
+def test_unique_ids_precomputed(keba_charger):
+    keba_charger._get_entity_state_by_unique_id.return_value = "16"
+    keba_charger.get_current_limit()
+    keba_charger._get_entity_state_by_unique_id.assert_called_with(
+        "keba_wallbox_abc123_max_current"
+    )
+    keba_charger._get_status()
+    keba_charger._get_entity_state_by_unique_id.assert_called_with(
+        "keba_wallbox_abc123_charging_state"
+    )
+
+
 def test_get_current_limit_success(keba_charger):
     keba_charger._get_entity_state_by_unique_id.return_value = "16"
     result = keba_charger.get_current_limit()
@@ -97,6 +109,12 @@ def test_get_current_limit_missing_entity(keba_charger):
     assert result is None
 
 
+def test_get_current_limit_unknown_state(keba_charger):
+    keba_charger._get_entity_state_by_unique_id.return_value = "unknown"
+    result = keba_charger.get_current_limit()
+    assert result is None
+
+
 def test_get_max_current_limit(keba_charger):
     result = keba_charger.get_max_current_limit()
     assert result == {Phase.L1: 32, Phase.L2: 32, Phase.L3: 32}
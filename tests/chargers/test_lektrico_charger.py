@@ -1,5 +1,6 @@
 """Tests for the Lektrico charger implementation."""
 
+import logging
 from unittest.mock import MagicMock, patch, AsyncMock
 
 import pytest
@@ -221,6 +222,34 @@ def test_get_current_limit_string_value(lektrico_charger):
     assert result == {Phase.L1: 20, Phase.L2: 20, Phase.L3: 20}
 
 
+def test_get_current_limit_decimal_value(lektrico_charger):
+    """Test retrieving the current limit when entity reports a decimal value."""
+    lektrico_charger._get_entity_state_by_key.return_value = "16.0"
+
+    assert lektrico_charger.get_current_limit() == {
+        Phase.L1: 16,
+        Phase.L2: 16,
+        Phase.L3: 16,
+    }
+
+
+def test_get_current_limit_unavailable(lektrico_charger):
+    """Test retrieving the current limit when the entity is unavailable."""
+    for state in ["unavailable", "unknown", None]:
+        lektrico_charger._get_entity_state_by_key.return_value = state
+        assert lektrico_charger.get_current_limit() is None
+
+
+def test_get_current_limit_unavailable_not_logged(lektrico_charger, caplog):
+    """Test an unavailable limit entity doesn't log a warning on every read."""
+    lektrico_charger._get_entity_state_by_key.return_value = "unavailable"
+
+    with caplog.at_level(logging.WARNING):
+        assert lektrico_charger.get_current_limit() is None
+
+    assert not caplog.records
+
+
 def test_get_max_current_limit_success(lektrico_charger):
     """Test retrieving the max current limit when entity exists."""
     # Mock the entity state
@@ -86,6 +86,30 @@ async def test_set_current_limit(zaptec_charger, mock_hass):
     )
 
 
+async def test_set_current_limit_unchanged_skips_service_call(zaptec_charger, mock_hass):
+    """Test no service call is made when the charger already has the limit."""
+    zaptec_charger._get_entity_state_by_translation_key.return_value = "14.0"
+
+    await zaptec_charger.set_current_limit({Phase.L1: 16, Phase.L2: 14, Phase.L3: 15})
+
+    mock_hass.services.async_call.assert_not_called()
+
+
+async def test_set_current_limit_holds_lock_during_write(zaptec_charger, mock_hass):
+    """Test concurrent limit writes are serialized by the charger lock."""
+    lock_held = []
+
+    async def record_lock(**_kwargs):
+        lock_held.append(zaptec_charger._set_limit_lock.locked())
+
+    mock_hass.services.async_call.side_effect = record_lock
+
+    await zaptec_charger.set_current_limit({Phase.L1: 16, Phase.L2: 16, Phase.L3: 16})
+
+    assert lock_held == [True]
+    assert not zaptec_charger._set_limit_lock.locked()
+
+
 def test_get_current_limit_success(zaptec_charger):
     """Test retrieving the current limit when entity exists."""
     # Mock the entity state
@@ -238,7 +262,7 @@ def test_can_charge_true(zaptec_charger):
 
         # Verify results
         assert result is True
-        zaptec_charger._get_entity_state_by_translation_key.assert_called_with(
+        zaptec_charger._get_entity_state_by_translation_key.assert_called_once_with(
             ZaptecEntityMap.Status
         )
 
@@ -290,3 +314,31 @@ def test_set_phase_mode_invalid(zaptec_charger):
         # Using a string instead of PhaseMode enum should raise ValueError
         zaptec_charger.set_phase_mode("invalid_mode", Phase.L1)
     assert "Invalid mode" in str(excinfo.value)
+
+
+def test_get_max_current_limit_reuses_parsed_value(zaptec_charger):
+    """Test the max limit is only re-parsed when the raw state changes."""
+    zaptec_charger._get_entity_state_by_translation_key.return_value = "32.0"
+    first = zaptec_charger.get_max_current_limit()
+    assert zaptec_charger.get_max_current_limit() is first
+
+    zaptec_charger._get_entity_state_by_translation_key.return_value = "20.0"
+    assert zaptec_charger.get_max_current_limit() == {
+        Phase.L1: 20,
+        Phase.L2: 20,
+        Phase.L3: 20,
+    }
+
+
+def test_get_current_limit_reuses_parsed_value(zaptec_charger):
+    """Test the current limit is only re-parsed when the raw state changes."""
+    zaptec_charger._get_entity_state_by_translation_key.return_value = "16.0"
+    first = zaptec_charger.get_current_limit()
+    assert zaptec_charger.get_current_limit() is first
+
+    zaptec_charger._get_entity_state_by_translation_key.return_value = "10.0"
+    assert zaptec_charger.get_current_limit() == {
+        Phase.L1: 10,
+        Phase.L2: 10,
+        Phase.L3: 10,
+    }
@@ -40,6 +40,7 @@ async def test_async_unload_mqtt_with_setup(z2m):
     mock_listener.assert_called_once()
 
     assert z2m._mqtt_listener is None
+    assert z2m._publish == z2m._async_mqtt_publish
     assert len(z2m._pending_requests) == 0
 
 
@@ -57,8 +58,8 @@ async def test_async_unload_mqtt_with_pending_requests(z2m):
     completed_future.set_result("result")
 
     z2m._pending_requests = {
-        "pending": pending_future,
-        "completed": completed_future,
+        "pending": [pending_future],
+        "completed": [completed_future],
     }
 
     await z2m.async_unload_mqtt()
@@ -110,9 +111,9 @@ async def test_message_received_resolves_pending_requests(z2m):
     power_future = asyncio.Future()
     state_future = asyncio.Future()
     z2m._pending_requests = {
-        "power": power_future,
-        "is_connected": state_future,
-        "other_prop": asyncio.Future(),
+        "power": [power_future],
+        "is_connected": [state_future],
+        "other_prop": [asyncio.Future()],
     }
 
     # Create a mock MQTT message
@@ -135,7 +136,7 @@ async def test_message_received_resolves_pending_requests(z2m):
     assert state_future.result() is False
 
     # Future for property not in the message should not be resolved
-    assert not z2m._pending_requests["other_prop"].done()
+    assert not z2m._pending_requests["other_prop"][0].done()
 
 
 def test_serialize_value(z2m):
@@ -173,9 +174,7 @@ async def test_message_received_handles_json_error(z2m, caplog):
 @pytest.mark.asyncio
 async def test_async_get_property_success(z2m):
     """Test successful property retrieval with async_get_property."""
-    with patch.object(z2m, '_async_mqtt_publish') as mock_publish:
-        z2m._mqtt_is_setup = MagicMock(return_value=True)
-
+    with patch.object(z2m, '_publish') as mock_publish:
         # Create a background task that will simulate a response message
         async def simulate_response():
             await asyncio.sleep(0.1)
@@ -209,14 +208,37 @@ async def test_async_get_property_success(z2m):
         assert "power" not in z2m._pending_requests
 
 
+@pytest.mark.asyncio
+async def test_async_get_property_concurrent_same_property(z2m):
+    """Test concurrent requests for the same property all receive the response."""
+    with patch.object(z2m, '_publish'):
+        first = asyncio.create_task(z2m.async_get_property("power"))
+        second = asyncio.create_task(z2m.async_get_property("power"))
+        await asyncio.sleep(0)
+
+        assert len(z2m._pending_requests["power"]) == 2
+
+        message = ReceiveMessage(
+            topic=z2m._topic_state,
+            payload=json.dumps({"power": 1500}),
+            qos=0,
+            retain=False,
+            subscribed_topic=z2m._topic_state,
+            timestamp=0,
+        )
+        z2m.message_received(message)
+
+        assert await first == 1500
+        assert await second == 1500
+        assert "power" not in z2m._pending_requests
+
+
 @pytest.mark.asyncio
 async def test_async_get_property_timeout(z2m):
     """Test property retrieval timeout with async_get_property."""
     # Mock the MQTT publish function and asyncio.wait_for
-    with patch.object(z2m, '_async_mqtt_publish') as mock_publish:
+    with patch.object(z2m, '_publish') as mock_publish:
         with patch('asyncio.wait_for', side_effect=TimeoutError):
-            z2m._mqtt_is_setup = MagicMock(return_value=True)
-
             result = await z2m.async_get_property("power", timeout=0.1)
             assert result is None  # None due to timeout
 
@@ -287,6 +309,9 @@ async def test_setup_mqtt_connection_and_message_handling(z2m):
         # Verify correct topic subscription
         assert callback_holder["topic"] == z2m._topic_state
 
+        # Publishing no longer goes through the setup guard
+        assert z2m._publish == z2m._async_mqtt_publish_unsafe
+
         # Simulate receiving a message on the topic
         message = ReceiveMessage(
             topic=callback_holder["topic"],
@@ -300,3 +325,14 @@ async def test_setup_mqtt_connection_and_message_handling(z2m):
 
         # Check that the state_cache was updated
         assert z2m._state_cache["power"] == 1234
+
+
+@pytest.mark.asyncio
+async def test_publish_before_setup_is_guarded(z2m, caplog):
+    """Test publishing before the MQTT subscription is set up logs an error."""
+    caplog.set_level(logging.ERROR)
+    with patch("custom_components.evse_load_balancer.chargers.util.zigbee2mqtt.mqtt.async_publish") as mock_publish:
+        await z2m._publish(topic=z2m._topic_set, payload={"power": 1})
+
+        mock_publish.assert_not_called()
+        assert "MQTT not set up" in caplog.text
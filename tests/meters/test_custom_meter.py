@@ -0,0 +1,69 @@
+"""Tests for the Custom Meter implementation."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer import config_flow as cf
+from custom_components.evse_load_balancer.meters.custom_meter import CustomMeter
+from custom_components.evse_load_balancer.meters.meter import Phase
+
+
+def _phase_config(phase_key):
+    return {
+        cf.CONF_PHASE_SENSOR_CONSUMPTION: f"sensor.{phase_key}_consumption",
+        cf.CONF_PHASE_SENSOR_PRODUCTION: f"sensor.{phase_key}_production",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: f"sensor.{phase_key}_voltage",
+    }
+
+
+@pytest.fixture
+def mock_hass():
+    hass = MagicMock()
+    states = {
+        "sensor.l1_consumption": "2.5",
+        "sensor.l1_production": "0.2",
+        "sensor.l1_voltage": "230",
+    }
+
+    def get_state(entity_id):
+        if entity_id not in states:
+            return None
+        state = MagicMock()
+        state.state = states[entity_id]
+        return state
+
+    hass.states.get.side_effect = get_state
+    return hass
+
+
+@pytest.fixture
+def custom_meter(mock_hass):
+    config_entry = MockConfigEntry(
+        domain="evse_load_balancer",
+        title="Custom Test Meter",
+        data={cf.CONF_PHASE_KEY_ONE: _phase_config(cf.CONF_PHASE_KEY_ONE)},
+        unique_id="test_custom_meter",
+    )
+    return CustomMeter(hass=mock_hass, config_entry=config_entry)
+
+
+def test_get_active_phase_power(custom_meter):
+    assert custom_meter.get_active_phase_power(Phase.L1) == pytest.approx(2.3)
+
+
+def test_get_active_phase_current(custom_meter):
+    assert custom_meter.get_active_phase_current(Phase.L1) == 10  # floor(2300/230)
+
+
+def test_get_active_phase_current_unconfigured_phase(custom_meter):
+    assert custom_meter.get_active_phase_current(Phase.L2) is None
+
+
+def test_get_tracking_entities_only_configured_phases(custom_meter):
+    assert custom_meter.get_tracking_entities() == [
+        "sensor.l1_consumption",
+        "sensor.l1_production",
+        "sensor.l1_voltage",
+    ]
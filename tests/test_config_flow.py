@@ -142,3 +142,10 @@ async def test_flow_power_step(hass):
     assert config_flow.CONF_PHASE_KEY_ONE in result["data_schema"].schema
     assert config_flow.CONF_PHASE_KEY_TWO in result["data_schema"].schema
     assert config_flow.CONF_PHASE_KEY_THREE in result["data_schema"].schema
+
+
+def test_create_phase_power_data_schema_is_memoized():
+    """Test the power step schema is only built once per phase count."""
+    schema = config_flow.create_phase_power_data_schema(2)
+    assert config_flow.create_phase_power_data_schema(2) is schema
+    assert config_flow.create_phase_power_data_schema(3) is not schema
@@ -16,6 +16,8 @@ from custom_components.evse_load_balancer.const import (
 )
 from custom_components.evse_load_balancer.coordinator import (
     EVSELoadBalancerCoordinator,
+    EXECUTION_CYCLE_DELAY,
+    FALLBACK_CYCLE_DELAY,
     MIN_CHARGER_UPDATE_DELAY,
 )
 from .helpers.mock_charger import MockCharger
@@ -793,3 +795,279 @@ def test_single_phase_charger_update_after_delay(coordinator_single_phase):
 
     # Charger should be updated
     coordinator_single_phase._charger.set_current_limit.assert_called_once()
+
+
+def test_fuse_size_option_override_read_at_init(mock_hass, mock_meter, mock_charger):
+    """Test the fuse size option override is resolved once when the coordinator is built."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="test_balancer_override",
+        data={"fuse_size": 25},
+        options={of.OPTION_MAX_FUSE_LOAD_AMPS: 20},
+    )
+    coordinator = EVSELoadBalancerCoordinator(
+        hass=mock_hass,
+        config_entry=config_entry,
+        meter=mock_meter,
+        charger=mock_charger,
+    )
+
+    assert coordinator.fuse_size == 20
+    assert coordinator.get_available_current_for_phase(Phase.L1) == 6
+
+
+def test_update_cycle_timer_rearms_before_running(coordinator):
+    """Test the loop timer re-arms itself and then runs an update cycle."""
+    coordinator.hass.loop.time.return_value = 100.0
+
+    with patch.object(coordinator, "_execute_update_cycle") as mock_execute:
+        coordinator._run_update_cycle()
+
+    coordinator.hass.loop.call_at.assert_called_once_with(
+        100.0 + EXECUTION_CYCLE_DELAY, coordinator._run_update_cycle
+    )
+    assert coordinator._update_cycle_timer is coordinator.hass.loop.call_at.return_value
+    assert coordinator._last_cycle_time == 100.0
+    mock_execute.assert_called_once()
+
+
+def test_idle_update_cycle_rearms_fallback_timer(coordinator):
+    """Test the timer falls back to the slow cadence without a charger to manage."""
+    coordinator.hass.loop.time.return_value = 100.0
+    coordinator._power_allocator.should_monitor.return_value = False
+
+    with patch.object(coordinator, "_execute_update_cycle"):
+        coordinator._run_update_cycle()
+
+    coordinator.hass.loop.call_at.assert_called_once_with(
+        100.0 + FALLBACK_CYCLE_DELAY, coordinator._run_update_cycle
+    )
+
+
+def test_meter_state_change_replaces_pending_cycle(coordinator):
+    """Test a meter state change cancels the fallback timer and runs a cycle right away."""
+    fallback_timer = MagicMock()
+    fallback_timer.when.return_value = 100.0 + FALLBACK_CYCLE_DELAY
+    coordinator._update_cycle_timer = fallback_timer
+    coordinator.hass.loop.time.return_value = 100.0
+
+    coordinator._handle_source_state_change(MagicMock())
+
+    fallback_timer.cancel.assert_called_once()
+    coordinator.hass.loop.call_at.assert_called_once_with(
+        100.0, coordinator._run_update_cycle
+    )
+
+
+def test_state_changes_run_at_most_one_cycle_per_execution_delay(coordinator):
+    """Test a state change right after a cycle waits for the execution delay."""
+    fallback_timer = MagicMock()
+    fallback_timer.when.return_value = 100.0 + FALLBACK_CYCLE_DELAY
+    coordinator._update_cycle_timer = fallback_timer
+    coordinator._last_cycle_time = 99.5
+    coordinator.hass.loop.time.return_value = 100.0
+
+    coordinator._handle_source_state_change(MagicMock())
+
+    fallback_timer.cancel.assert_called_once()
+    coordinator.hass.loop.call_at.assert_called_once_with(
+        99.5 + EXECUTION_CYCLE_DELAY, coordinator._run_update_cycle
+    )
+
+
+def test_state_change_keeps_cycle_already_due(coordinator):
+    """Test a state change doesn't reschedule a cycle that is already due."""
+    timer = MagicMock()
+    timer.when.return_value = 100.0 + EXECUTION_CYCLE_DELAY
+    coordinator._update_cycle_timer = timer
+    coordinator._last_cycle_time = 100.0
+    coordinator.hass.loop.time.return_value = 100.2
+
+    coordinator._handle_source_state_change(MagicMock())
+
+    timer.cancel.assert_not_called()
+    coordinator.hass.loop.call_at.assert_not_called()
+
+
+async def test_async_unload_cancels_update_cycle_timer(coordinator):
+    """Test unloading the coordinator cancels the pending update cycle."""
+    timer = MagicMock()
+    coordinator._update_cycle_timer = timer
+
+    await coordinator.async_unload()
+
+    timer.cancel.assert_called_once()
+    assert coordinator._update_cycle_timer is None
+
+
+def test_last_check_timestamp_uses_cycle_time(coordinator):
+    """Test the last check timestamp is the time handed to the update cycle."""
+    now = datetime.now().astimezone()
+
+    coordinator._execute_update_cycle(now)
+
+    assert coordinator.get_last_check_timestamp is now
+
+
+def test_idle_cycle_skips_meter_reads(coordinator):
+    """Test an idle charger skips the balancing meter reads but still updates sensors."""
+    coordinator._power_allocator.should_monitor.return_value = False
+    now = datetime.now().astimezone()
+
+    coordinator._execute_update_cycle(now)
+
+    assert coordinator.get_last_check_timestamp is now
+    coordinator._power_allocator.should_monitor.assert_called_once()
+    coordinator._meter.get_active_phase_current.assert_not_called()
+    coordinator._balancer_algo.compute_availability.assert_not_called()
+    for sensor in coordinator._sensors:
+        assert sensor.async_write_ha_state.called
+
+
+def test_sensor_state_only_written_when_value_changes(coordinator):
+    """Test sensors are only written when their value differs from the last write."""
+    sensor = MagicMock()
+    sensor.native_value = 10
+    coordinator._sensors = [sensor]
+
+    coordinator._async_update_sensors()
+    coordinator._async_update_sensors()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    sensor.native_value = 12
+    coordinator._async_update_sensors()
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_register_sensor_is_idempotent(coordinator):
+    """Test registering a sensor twice keeps a single entry and unregistering is safe."""
+    sensor = MagicMock()
+    coordinator._sensors = set()
+
+    coordinator.register_sensor(sensor)
+    coordinator.register_sensor(sensor)
+    assert coordinator._sensors == {sensor}
+
+    coordinator.unregister_sensor(sensor)
+    coordinator.unregister_sensor(sensor)
+    assert coordinator._sensors == set()
+
+
+def test_charger_limit_written_in_eager_background_task(coordinator):
+    """Test the charger limit is written from an eagerly started background task."""
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator.hass.async_create_background_task.assert_called_once()
+    kwargs = coordinator.hass.async_create_background_task.call_args[1]
+    assert kwargs["eager_start"] is True
+    assert kwargs["name"] == f"{DOMAIN}_set_current_limit"
+
+
+def test_no_update_when_target_equals_last_sent(coordinator):
+    """Test the charger isn't written again when the allocation equals the last target."""
+    coordinator._last_charger_target_update = (
+        {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16},
+        int(datetime.now().timestamp()) - 10,
+    )
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._charger.set_current_limit.assert_not_called()
+    coordinator.hass.bus.async_fire.assert_not_called()
+    coordinator._power_allocator.update_applied_current.assert_not_called()
+
+
+def test_no_update_while_last_target_write_is_running(coordinator):
+    """Test a repeated target isn't sent again while its write is still running."""
+    coordinator._last_charger_target_update = (
+        {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16},
+        int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10),
+    )
+    coordinator._charger_update_task = MagicMock()
+    coordinator._charger_update_task.done.return_value = False
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._charger.set_current_limit.assert_not_called()
+
+
+def test_last_target_retried_after_delay(coordinator):
+    """Test a target the charger didn't take is sent again once the delay has passed."""
+    min_charge_minutes = of.EvseLoadBalancerOptionsFlow.get_option_value(
+        coordinator.config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
+    )
+    last_target = {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16}
+    coordinator._last_charger_target_update = (
+        last_target,
+        int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10 + (min_charge_minutes * 60)),
+    )
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._charger.set_current_limit.assert_called_once_with(last_target)
+    coordinator._power_allocator.update_applied_current.assert_called_once()
+
+
+def test_throttled_limits_are_deferred(coordinator):
+    """Test limits proposed during the update delay are applied once it has passed."""
+    coordinator._last_charger_target_update = (
+        {Phase.L1: 10, Phase.L2: 10, Phase.L3: 10},
+        int(datetime.now().timestamp()) - 10,
+    )
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_call_later"
+    ) as mock_call_later:
+        coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._charger.set_current_limit.assert_not_called()
+    assert coordinator._pending_limits == {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16}
+    mock_call_later.assert_called_once()
+    assert mock_call_later.call_args[0][1] > 0
+    assert mock_call_later.call_args[0][2] == coordinator._flush_pending_limits
+
+
+def test_deferred_reduction_rearms_shorter_timer(coordinator):
+    """Test a reduction deferred after an increase isn't held back by the increase's delay."""
+    coordinator._last_charger_target_update = (
+        {Phase.L1: 10, Phase.L2: 10, Phase.L3: 10},
+        int(datetime.now().timestamp()) - 10,
+    )
+    increase = {Phase.L1: 12, Phase.L2: 12, Phase.L3: 12}
+    reduction = {Phase.L1: 8, Phase.L2: 8, Phase.L3: 8}
+    coordinator._charge_limit_hysteresis = 15
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_call_later"
+    ) as mock_call_later:
+        first_unsub = MagicMock()
+        mock_call_later.return_value = first_unsub
+        coordinator._defer_charger_settings(increase)
+        coordinator._defer_charger_settings(reduction)
+
+    assert coordinator._pending_limits == reduction
+    first_unsub.assert_called_once()
+    assert mock_call_later.call_count == 2
+    increase_delay = mock_call_later.call_args_list[0][0][1]
+    reduction_delay = mock_call_later.call_args_list[1][0][1]
+    assert reduction_delay <= MIN_CHARGER_UPDATE_DELAY < increase_delay
+
+
+def test_flush_pending_limits_applies_them(coordinator):
+    """Test pending limits are sent to the charger once the update delay has passed."""
+    min_charge_minutes = of.EvseLoadBalancerOptionsFlow.get_option_value(
+        coordinator.config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
+    )
+    coordinator._last_charger_target_update = (
+        {Phase.L1: 10, Phase.L2: 10, Phase.L3: 10},
+        int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10 + (min_charge_minutes * 60)),
+    )
+    pending_limits = {Phase.L1: 12, Phase.L2: 12, Phase.L3: 12}
+    coordinator._pending_limits = pending_limits
+
+    coordinator._flush_pending_limits(datetime.now())
+
+    coordinator._charger.set_current_limit.assert_called_once_with(pending_limits)
+    coordinator._power_allocator.update_applied_current.assert_called_once()
+    assert coordinator._pending_limits is None
+    assert coordinator._pending_limits_unsub is None
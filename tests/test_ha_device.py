@@ -0,0 +1,78 @@
+"""Tests for the HaDevice base class."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from custom_components.evse_load_balancer.ha_device import HaDevice
+
+
+def _registry_entry(entity_id, translation_key, unique_id, disabled=False):
+    entry = MagicMock()
+    entry.entity_id = entity_id
+    entry.translation_key = translation_key
+    entry.unique_id = unique_id
+    entry.disabled = disabled
+    return entry
+
+
+@pytest.fixture
+def ha_device():
+    device_entry = MagicMock(spec=DeviceEntry)
+    device_entry.id = "device_123"
+    entities = [
+        _registry_entry("sensor.status", "status", "device_123_status"),
+        _registry_entry("number.limit", "limit", "device_123_limit"),
+        _registry_entry("sensor.other_status", "status", "device_123_other"),
+    ]
+    entity_registry = MagicMock()
+    entity_registry.entities.get_entries_for_device_id.return_value = entities
+    with patch(
+        "custom_components.evse_load_balancer.ha_device.er.async_get",
+        return_value=entity_registry,
+    ):
+        device = HaDevice(MagicMock(), device_entry)
+    device.refresh_entities()
+    return device
+
+
+def test_get_entity_id_by_translation_key(ha_device):
+    assert ha_device._get_entity_id_by_translation_key("limit") == "number.limit"
+
+
+def test_get_entity_id_by_translation_key_keeps_first_match(ha_device):
+    assert ha_device._get_entity_id_by_translation_key("status") == "sensor.status"
+
+
+def test_get_entity_id_by_translation_key_missing(ha_device):
+    with pytest.raises(ValueError, match="Entity not found for translation_key"):
+        ha_device._get_entity_id_by_translation_key("missing")
+
+
+def test_get_entity_id_by_unique_id(ha_device):
+    assert ha_device._get_entity_id_by_unique_id("device_123_limit") == "number.limit"
+
+
+def test_get_entity_id_by_unique_id_missing(ha_device):
+    with pytest.raises(ValueError, match="Entity not found for unique_id"):
+        ha_device._get_entity_id_by_unique_id("device_123_missing")
+
+
+def test_get_entity_id_by_key_is_memoized(ha_device):
+    assert ha_device._get_entity_id_by_key("other") == "sensor.other_status"
+
+    # Later lookups don't scan the entity list again
+    ha_device.entities = []
+    assert ha_device._get_entity_id_by_key("other") == "sensor.other_status"
+
+
+def test_refresh_entities_drops_memoized_keys(ha_device):
+    ha_device._get_entity_id_by_key("other")
+    ha_device.entities = []
+
+    with patch.object(HaDevice, "_get_entities_for_device"):
+        ha_device.refresh_entities()
+
+    with pytest.raises(ValueError, match="unique_id ending with 'other'"):
+        ha_device._get_entity_id_by_key("other")
@@ -0,0 +1,44 @@
+"""Tests for the logbook descriptions."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.logbook import LOGBOOK_ENTRY_MESSAGE
+
+from custom_components.evse_load_balancer.const import (
+    EVENT_ACTION_NEW_CHARGER_LIMITS,
+    EVENT_ATTR_ACTION,
+    EVENT_ATTR_NEW_LIMITS,
+    Phase,
+)
+from custom_components.evse_load_balancer.logbook import async_describe_events
+
+
+@pytest.fixture
+def describe_charger_event():
+    """Return the describer registered for the coordinator event."""
+    async_describe_event = MagicMock()
+    async_describe_events(MagicMock(), async_describe_event)
+    return async_describe_event.call_args.args[2]
+
+
+def test_describe_new_charger_limits(describe_charger_event):
+    """Test the new limits are described as a single string."""
+    event = MagicMock()
+    event.data = {
+        EVENT_ATTR_ACTION: EVENT_ACTION_NEW_CHARGER_LIMITS,
+        EVENT_ATTR_NEW_LIMITS: {Phase.L1: 10, Phase.L2: 12},
+    }
+
+    description = describe_charger_event(event)
+
+    assert description[LOGBOOK_ENTRY_MESSAGE] == "charger limits set to: l1: 10A, l2: 12A"
+
+
+def test_describe_unknown_action(describe_charger_event):
+    """Test an unknown action raises."""
+    event = MagicMock()
+    event.data = {EVENT_ATTR_ACTION: "unknown"}
+
+    with pytest.raises(ValueError, match="Unknown action"):
+        describe_charger_event(event)